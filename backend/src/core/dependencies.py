@@ -1,12 +1,83 @@
-from typing import Annotated
+import json
+from datetime import datetime
+from typing import Annotated, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
 from src.models.user import User
+from src.core.redis import get_redis
 from src.core.security import decode_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# This doesn't REQUIRE auth but uses it if present
+oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
+
+# Short-TTL Redis cache of the user row looked up on every authenticated
+# request. 20s is long enough to absorb bursts from a single client but
+# short enough that deactivations/profile edits propagate quickly.
+USER_CACHE_TTL_SECONDS = 20
+
+_USER_CACHE_FIELDS = (
+    "id", "username", "email", "password_hash", "display_name", "bio",
+    "profile_image", "banner_image", "is_verified", "is_active", "is_admin",
+    "created_at", "updated_at",
+)
+
+
+def user_cache_key(user_id: int) -> str:
+    """Redis key for the cached user row."""
+    return f"user:{user_id}"
+
+
+async def get_cached_user(user_id: int) -> Optional[User]:
+    """
+    Load a User from the Redis cache, or None on miss.
+
+    Fails open: if Redis is unreachable, or the cached value can't be
+    decoded (a stale entry from an older schema), treat it as a miss
+    and fall back to the DB.
+    """
+    try:
+        redis = await get_redis()
+        raw = await redis.get(user_cache_key(user_id))
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        # Rebuild a real ORM instance so relations and .save() still work
+        return User._init_from_db(**data)
+    except Exception:
+        return None
+
+
+async def cache_user(user: User) -> None:
+    """Store the user row in Redis with a short TTL (best effort)."""
+    data = {}
+    for field in _USER_CACHE_FIELDS:
+        value = getattr(user, field)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        data[field] = value
+
+    try:
+        redis = await get_redis()
+        await redis.set(
+            user_cache_key(user.id),
+            json.dumps(data),
+            ex=USER_CACHE_TTL_SECONDS,
+        )
+    except Exception:
+        pass
+
+
+async def invalidate_cached_user(user_id: int) -> None:
+    """Drop the cached user row (call after profile updates)."""
+    try:
+        redis = await get_redis()
+        await redis.delete(user_cache_key(user_id))
+    except Exception:
+        pass
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)]
@@ -36,10 +107,15 @@ async def get_current_user(
     except ValueError:
         raise credentials_exception
     
-    user = await User.get_or_none(id=user_id)
-    
+    user = await get_cached_user(user_id)
+
     if user is None:
-        raise credentials_exception
+        user = await User.get_or_none(id=user_id)
+
+        if user is None:
+            raise credentials_exception
+
+        await cache_user(user)
     
     if not user.is_active:
         raise HTTPException(
@@ -50,6 +126,32 @@ async def get_current_user(
     return user
 
 
+async def get_current_user_optional(
+    token: Annotated[Optional[str], Depends(oauth2_scheme_optional)]
+) -> Optional[User]:
+    """
+    Get current user if authenticated, None otherwise.
+
+    Use this for routes that are public but show extra info when logged in.
+    Example: Post list shows "is_liked" only when authenticated.
+
+    Shared by all routers so FastAPI's per-request dependency cache can
+    reuse the result (caching only kicks in for the same function object).
+    """
+    if not token:
+        return None
+
+    payload = decode_token(token)
+    if not payload or payload.get("type") != "access":
+        return None
+
+    user_id = payload.get("sub")
+    if not user_id:
+        return None
+
+    return await User.get_or_none(id=int(user_id), is_active=True)
+
+
 async def get_current_active_verified_user(
     user: Annotated[User, Depends(get_current_user)]
 ) -> User:
@@ -81,5 +183,6 @@ async def get_current_admin_user(
 
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
+OptionalUser = Annotated[Optional[User], Depends(get_current_user_optional)]
 VerifiedUser = Annotated[User, Depends(get_current_active_verified_user)]
 AdminUser = Annotated[User, Depends(get_current_admin_user)]
\ No newline at end of file
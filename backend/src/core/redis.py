@@ -1,22 +1,22 @@
 import redis.asyncio as redis
 from src.core.config import get_settings
 
-redis_client: redis.Redis | None = None
+settings = get_settings()
+
+# Single client created once at import time. Connections are lazy (the
+# pool only dials on the first command), so this is safe before startup
+# and removes the per-call "is it initialized yet?" branch and global
+# rebind from every cached code path.
+redis_client: redis.Redis = redis.from_url(
+    settings.redis_url,
+    encoding="utf-8",
+    decode_responses=True,
+    max_connections=100,
+    health_check_interval=30,
+)
 
 async def get_redis() -> redis.Redis:
-    global redis_client
-    if redis_client is None:
-        settings = get_settings()
-        print(f"Connecting to Redis: {settings.redis_url}")
-        redis_client = redis.from_url(
-            settings.redis_url,
-            encoding="utf-8",
-            decode_responses=True,
-        )
     return redis_client
 
 async def close_redis():
-    global redis_client
-    if redis_client:
-        await redis_client.close()
-        redis_client = None
\ No newline at end of file
+    await redis_client.aclose()
@@ -1,8 +1,32 @@
+from tortoise import Tortoise
 from tortoise.contrib.fastapi import register_tortoise
 from src.core.config import get_settings
 
 settings = get_settings()
 
+# Partial indexes over live rows only. Every PostService query filters
+# on is_deleted=False, so excluding tombstones keeps these indexes small
+# and the scans free of dead rows. generate_schemas can't express a
+# WHERE clause, hence raw DDL; both SQLite and Postgres support it, and
+# IF NOT EXISTS makes the statements idempotent across restarts.
+PARTIAL_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS posts_active_created_idx "
+    "ON posts (created_at DESC, id DESC) WHERE NOT is_deleted",
+    "CREATE INDEX IF NOT EXISTS posts_active_author_idx "
+    "ON posts (author_id, created_at DESC) WHERE NOT is_deleted",
+    "CREATE INDEX IF NOT EXISTS posts_active_parent_idx "
+    "ON posts (parent_id) WHERE NOT is_deleted",
+    "CREATE INDEX IF NOT EXISTS posts_active_repost_idx "
+    "ON posts (repost_of_id) WHERE NOT is_deleted",
+)
+
+
+async def create_partial_indexes() -> None:
+    """Create the soft-delete partial indexes (run after Tortoise init)."""
+    conn = Tortoise.get_connection("default")
+    for statement in PARTIAL_INDEXES:
+        await conn.execute_script(statement)
+
 
 def init_db(app):
     """
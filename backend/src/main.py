@@ -1,11 +1,13 @@
 import asyncio
+import json
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.core.redis import close_redis
 from src.tasks.flush_views import flush_views_job
-from src.database import init_db
+from src.database import create_partial_indexes, init_db
 from src.core.config import get_settings
 from src.routers import auth, posts, tags, users
 
@@ -13,7 +15,8 @@ settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
+    # Startup (register_tortoise's lifespan has already connected)
+    await create_partial_indexes()
     flush_task = asyncio.create_task(flush_views_job())
     
     yield
@@ -48,7 +51,10 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the large paginated responses (feed, post lists)
+    # several times faster than the stdlib encoder
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -70,17 +76,77 @@ app.include_router(posts.router)
 app.include_router(tags.router)
 
 
+# Post bodies are capped at 500 chars, so anything past 4 KB (headroom
+# for JSON framing and multi-byte chars) can be rejected before the
+# request body is read or any auth dependency runs
+MAX_POST_BODY_BYTES = 4096
+
+# Paths where every method requires auth - requests without an
+# Authorization header are refused before JWT/DB work starts
+AUTH_REQUIRED_PATHS = frozenset({
+    "/auth/me",
+    "/auth/logout",
+    "/posts/feed",
+    "/posts/views",
+    "/users/me",
+})
+
+
+@app.middleware("http")
+async def reject_before_auth(request, call_next):
+    """
+    Short-circuit requests that would be rejected anyway, before the
+    dependency graph (token decode + user lookup) gets resolved.
+    """
+    # Only post create/update carry a capped body; other /posts POSTs
+    # (like /posts/views, whose payload is a list of ids) are exempt
+    path = request.url.path
+    if (request.method == "POST" and path in ("/posts", "/posts/")) or (
+        request.method == "PATCH" and path.startswith("/posts/")
+    ):
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > MAX_POST_BODY_BYTES:
+            return ORJSONResponse(
+                status_code=413,
+                content={"detail": "Request body too large"},
+            )
+
+    # CORS preflights carry no Authorization header by spec; this
+    # middleware runs outside CORSMiddleware, so OPTIONS must pass
+    # through to it or cross-origin clients can never authenticate
+    if (
+        request.method != "OPTIONS"
+        and path in AUTH_REQUIRED_PATHS
+        and "authorization" not in request.headers
+    ):
+        return ORJSONResponse(
+            status_code=401,
+            content={"detail": "Not authenticated"},
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return await call_next(request)
+
+
+# Both health payloads are static for the lifetime of the process, so
+# serialize them once - load balancers hit these paths constantly and a
+# fresh dict + JSON encode per probe is pure overhead.
+_ROOT_BODY = json.dumps({
+    "name": settings.app_name,
+    "version": "0.1.0",
+    "status": "running",
+    "docs": "/docs",
+}).encode()
+
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
 @app.get("/", tags=["Health"])
 async def root():
     """
     Root endpoint - useful for health checks.
     """
-    return {
-        "name": settings.app_name,
-        "version": "0.1.0",
-        "status": "running",
-        "docs": "/docs",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health", tags=["Health"])
@@ -88,6 +154,6 @@ async def health_check():
     """
     Health check endpoint for monitoring.
     """
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 init_db(app)
\ No newline at end of file
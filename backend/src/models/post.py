@@ -49,6 +49,15 @@ class Post(Model):
         description="Original post if this is a repost"
     )
     
+    # Denormalized engagement counters, maintained by the service layer
+    # (F-expression updates on like/unlike, reply/repost create and soft
+    # delete). Reading them is free on every timeline row; the
+    # M2M/FK relations remain the ground truth if they ever need a
+    # rebuild.
+    like_count = fields.IntField(default=0)
+    reply_count = fields.IntField(default=0)
+    repost_count = fields.IntField(default=0)
+
     is_deleted = fields.BooleanField(
         default=False,
         description="Soft delete flag"
@@ -67,7 +76,12 @@ class Post(Model):
     class Meta:
         table = "posts"
         ordering = ["-created_at"]  # Newest first
-    
+        indexes = (
+            ("created_at", "id"),  # Keyset pagination cursor
+            ("is_deleted", "created_at", "id"),  # Covers the list/feed scans
+            ("author_id", "created_at"),  # Per-author timelines
+        )
+
     def __str__(self) -> str:
         preview = self.body[:30] + "..." if len(self.body) > 30 else self.body
         return f"Post(id={self.id}, author_id={self.author_id}, body='{preview}')"
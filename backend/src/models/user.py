@@ -1,23 +1,32 @@
 from tortoise import Model, fields
-from tortoise.validators import RegexValidator
+from tortoise.exceptions import ValidationError
+from tortoise.signals import pre_save
 import re
 
+# Compiled once at import; validation is just a match call per write
+EMAIL_REGEX = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", re.IGNORECASE)
+
+
+def validate_email(value: str) -> None:
+    """Field validator backed by the precompiled module-level pattern."""
+    if not EMAIL_REGEX.match(value):
+        raise ValidationError(f"'{value}' is not a valid email address")
+
 
 class User(Model):
-    EMAIL_REGEX = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
-    
+
     id = fields.IntField(pk=True)
-    
+
     username = fields.CharField(
         max_length=30,
         unique=True,
         description="Unique username"
     )
-    
+
     email = fields.CharField(
         max_length=255,
         unique=True,
-        validators=[RegexValidator(EMAIL_REGEX, flags=re.IGNORECASE)],
+        validators=[validate_email],
         description="User email address"
     )
     
@@ -90,6 +99,22 @@ class User(Model):
     
     def __str__(self) -> str:
         return f"User(id={self.id}, username={self.username})"
-    
+
     class PydanticMeta:
-        exclude = ["password_hash"]
\ No newline at end of file
+        exclude = ["password_hash"]
+
+
+@pre_save(User)
+async def _normalize_identifiers(sender, instance, using_db, update_fields) -> None:
+    """
+    Store username/email in canonical lowercase form.
+
+    Lookups use plain equality on the lowercased input, which hits the
+    unique index directly - no LOWER() or case-insensitive comparison at
+    query time. Enforcing the canonical form here means no code path can
+    sneak a mixed-case value in and break those lookups.
+    """
+    if instance.username:
+        instance.username = instance.username.lower()
+    if instance.email:
+        instance.email = instance.email.lower()
\ No newline at end of file
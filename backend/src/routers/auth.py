@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from typing import Annotated
@@ -18,55 +20,64 @@ from src.core.dependencies import CurrentUser
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
-async def user_to_public_response(user) -> dict:
+async def user_to_public_response(user) -> UserOut:
     """Public profile - no email (for viewing other users)."""
-    return {
-        "id": user.id,
-        "username": user.username,
-        "display_name": user.display_name,
-        "bio": user.bio,
-        "profile_image": user.profile_image,
-        "banner_image": user.banner_image,
-        "is_verified": user.is_verified,
-        "created_at": user.created_at,
-        "follower_count": 0,
-        "following_count": 0,
-        "post_count": 0,
-        "is_following": False,
-        "is_followed_by": False,
-    }
-
-
-async def user_to_private_response(user) -> dict:
+    # model_construct skips a pydantic validation pass on values that
+    # came straight out of the ORM and server-side code
+    return UserOut.model_construct(
+        id=user.id,
+        username=user.username,
+        display_name=user.display_name,
+        bio=user.bio,
+        profile_image=user.profile_image,
+        banner_image=user.banner_image,
+        is_verified=user.is_verified,
+        created_at=user.created_at,
+        follower_count=0,
+        following_count=0,
+        post_count=0,
+        is_following=False,
+        is_followed_by=False,
+    )
+
+
+async def user_to_private_response(user) -> UserPrivate:
     """Private profile - includes email (for your own profile)."""
 
-    follower_count = await user.followers.all().count()
-    following_count = await user.following.all().count()
-    post_count = await user.posts.filter(is_deleted=False).count()
-
-    return {
-        "id": user.id,
-        "username": user.username,
-        "email": user.email,
-        "display_name": user.display_name,
-        "bio": user.bio,
-        "profile_image": user.profile_image,
-        "banner_image": user.banner_image,
-        "is_verified": user.is_verified,
-        "is_active": user.is_active,
-        "is_admin": user.is_admin,
-        "created_at": user.created_at,
-        "updated_at": user.updated_at,
-        "follower_count": follower_count,
-        "following_count": following_count,
-        "post_count": post_count,
-        "is_following": False,
-        "is_followed_by": False,
-    }
+    # The three counts are independent round-trips - run them
+    # concurrently so the endpoint waits for the slowest, not the sum
+    follower_count, following_count, post_count = await asyncio.gather(
+        user.followers.all().count(),
+        user.following.all().count(),
+        user.posts.filter(is_deleted=False).count(),
+    )
+
+    return UserPrivate.model_construct(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        display_name=user.display_name,
+        bio=user.bio,
+        profile_image=user.profile_image,
+        banner_image=user.banner_image,
+        is_verified=user.is_verified,
+        is_active=user.is_active,
+        is_admin=user.is_admin,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+        follower_count=follower_count,
+        following_count=following_count,
+        post_count=post_count,
+        is_following=False,
+        is_followed_by=False,
+    )
 
 @router.post(
     "/register",
-    response_model=UserPrivate,
+    # response_model intentionally omitted: the helper returns an
+    # already-built UserPrivate, and letting FastAPI re-validate it
+    # would repeat the pydantic pass on trusted data
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
     summary="Register a new user",
 )
@@ -126,7 +137,7 @@ async def refresh_token(data: RefreshTokenRequest):
 
 @router.get(
     "/me",
-    response_model=UserPrivate,
+    response_model=None,  # see /register - returns a built UserPrivate
     summary="Get current user profile",
 )
 async def get_current_user_profile(user: CurrentUser):
@@ -1,9 +1,7 @@
 from typing import Literal, Optional
-from fastapi import APIRouter, Query, status, Depends
-from typing import Annotated
+from fastapi import APIRouter, Query, status
 from src.services.views import view_service
 
-from src.models.user import User
 from src.schemas.post import (
     PostCreate,
     PostUpdate,
@@ -12,42 +10,11 @@ from src.schemas.post import (
     LikeResponse,
 )
 from src.services.posts import post_service
-from src.core.dependencies import CurrentUser
-from fastapi.security import OAuth2PasswordBearer
-from src.core.security import decode_token
+from src.core.dependencies import CurrentUser, OptionalUser
 
 router = APIRouter(prefix="/posts", tags=["Posts"])
 
 
-# This doesn't REQUIRE auth but uses it if present
-oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
-
-async def get_current_user_optional(
-    token: Annotated[Optional[str], Depends(oauth2_scheme_optional)]
-) -> Optional[User]:
-    """
-    Get current user if authenticated, None otherwise.
-    
-    Use this for routes that are public but show extra info when logged in.
-    Example: Post list shows "is_liked" only when authenticated.
-    """
-    if not token:
-        return None
-    
-    payload = decode_token(token)
-    if not payload or payload.get("type") != "access":
-        return None
-    
-    user_id = payload.get("sub")
-    if not user_id:
-        return None
-    
-    return await User.get_or_none(id=int(user_id), is_active=True)
-
-
-OptionalUser = Annotated[Optional[User], Depends(get_current_user_optional)]
-
-
 @router.post(
     "/",
     response_model=PostOut,
@@ -63,8 +30,7 @@ async def create_post(
     data: PostCreate,
     user: CurrentUser,  # Requires authentication
 ):
-    post = await post_service.create_post(data, user)
-    return await post_service.get_post(post.id, user)
+    return await post_service.create_post(data, user)
 
 @router.get(
     "/",
@@ -78,8 +44,15 @@ async def list_posts(
     sort_by: Literal["recent", "popular"] = Query("recent", description="Sort order"),
     limit: int = Query(20, ge=1, le=100, description="Max posts to return"),
     offset: int = Query(0, ge=0, description="Number of posts to skip"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (preferred over offset)"),
+    include_total: bool = Query(True, description="Compute the total count (skipped with cursor paging)"),
 ):
-    
+    if tags:
+        # Canonicalize untrusted input at the boundary: lowercase and
+        # de-dupe (order-preserving) so the service and the SQL IN list
+        # see one clean set and duplicates can't multiply the tag join
+        tags = list(dict.fromkeys(t.lower() for t in tags))
+
     return await post_service.list_posts(
         limit=limit,
         offset=offset,
@@ -87,6 +60,8 @@ async def list_posts(
         tags=tags,
         current_user=user,
         sort_by=sort_by,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -99,8 +74,12 @@ async def get_feed(
     user: CurrentUser,  # Requires authentication
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (preferred over offset)"),
+    include_total: bool = Query(True, description="Compute the total count (skipped with cursor paging)"),
 ):
-    return await post_service.get_feed(user, limit, offset)
+    return await post_service.get_feed(
+        user, limit, offset, cursor=cursor, include_total=include_total
+    )
 
 
 @router.get(
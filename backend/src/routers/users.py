@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Query, status, HTTPException
-from typing import Optional, Annotated
-from fastapi import Depends
+from typing import Optional
+from tortoise import Tortoise
 
 from src.models.user import User
 from src.schemas.user import (
@@ -11,31 +11,11 @@ from src.schemas.user import (
     FollowResponse,
     FollowerList,
 )
-from src.core.dependencies import CurrentUser
-from src.core.security import decode_token
-from fastapi.security import OAuth2PasswordBearer
+from src.core.dependencies import CurrentUser, OptionalUser, invalidate_cached_user
+from src.services import counters, membership
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
-oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
-
-
-async def get_current_user_optional(
-    token: Annotated[Optional[str], Depends(oauth2_scheme_optional)]
-) -> Optional[User]:
-    if not token:
-        return None
-    payload = decode_token(token)
-    if not payload or payload.get("type") != "access":
-        return None
-    user_id = payload.get("sub")
-    if not user_id:
-        return None
-    return await User.get_or_none(id=int(user_id), is_active=True)
-
-
-OptionalUser = Annotated[Optional[User], Depends(get_current_user_optional)]
-
 
 @router.get(
     "/me",
@@ -69,6 +49,7 @@ async def update_my_profile(
         setattr(user, field, value)
     
     await user.save()
+    await invalidate_cached_user(user.id)
     return await _user_to_private_schema(user)
 
 from tortoise.expressions import Q
@@ -150,14 +131,20 @@ async def follow_user(
             detail="You cannot follow yourself"
         )
     
-    # Check if already following
-    is_following = await user.following.filter(id=target.id).exists()
-    
+    # Check if already following (Redis mirror first, DB on cold cache)
+    is_following = await membership.is_following_cached(user.id, target.id)
+    if is_following is None:
+        followed_ids = await user.following.all().values_list("id", flat=True)
+        is_following = target.id in followed_ids
+        await membership.backfill_following(user.id, followed_ids)
+
     if not is_following:
         await user.following.add(target)
-    
+        await membership.record_follow(user.id, target.id)
+        await counters.adjust_follow_counts(user.id, target.id, +1)
+
     follower_count = await target.followers.all().count()
-    
+
     return FollowResponse(
         following=True,
         follower_count=follower_count
@@ -184,10 +171,19 @@ async def unfollow_user(
             detail="User not found"
         )
     
-    await user.following.remove(target)
-    
+    was_following = await membership.is_following_cached(user.id, target.id)
+    if was_following is None:
+        followed_ids = await user.following.all().values_list("id", flat=True)
+        was_following = target.id in followed_ids
+        await membership.backfill_following(user.id, followed_ids)
+
+    if was_following:
+        await user.following.remove(target)
+        await membership.record_unfollow(user.id, target.id)
+        await counters.adjust_follow_counts(user.id, target.id, -1)
+
     follower_count = await target.followers.all().count()
-    
+
     return FollowResponse(
         following=False,
         follower_count=follower_count
@@ -215,27 +211,7 @@ async def get_followers(
             detail="User not found"
         )
     
-    total = await user.followers.all().count()
-    followers = await user.followers.all().offset(offset).limit(limit)
-    
-    items = [
-        UserBrief(
-            id=f.id,
-            username=f.username,
-            display_name=f.display_name,
-            profile_image=f.profile_image,
-            is_verified=f.is_verified,
-        )
-        for f in followers
-    ]
-    
-    return FollowerList(
-        items=items,
-        total=total,
-        limit=limit,
-        offset=offset,
-        has_more=(offset + limit) < total,
-    )
+    return await _fetch_follow_page(user.id, "followers", limit, offset)
 
 
 @router.get(
@@ -259,20 +235,55 @@ async def get_following(
             detail="User not found"
         )
     
-    total = await user.following.all().count()
-    following = await user.following.all().offset(offset).limit(limit)
-    
+    return await _fetch_follow_page(user.id, "following", limit, offset)
+
+
+async def _fetch_follow_page(
+    user_id: int,
+    relation: str,
+    limit: int,
+    offset: int,
+) -> FollowerList:
+    """
+    Fetch one page of a user's followers or following as a FollowerList.
+
+    A separate COUNT(*) plus a page query means two scans of the
+    relation; COUNT(*) OVER () piggybacks the total on the page rows.
+    """
+    conn = Tortoise.get_connection("default")
+    if conn.capabilities.dialect == "postgres":
+        uid_ph, limit_ph, offset_ph = "$1", "$2", "$3"
+    else:
+        uid_ph = limit_ph = offset_ph = "?"
+
+    if relation == "followers":
+        # Rows where this user is the one being followed
+        join_clause = f"f.users_id = u.id AND f.user_id = {uid_ph}"
+    else:
+        # Rows where this user is the follower
+        join_clause = f"f.user_id = u.id AND f.users_id = {uid_ph}"
+
+    rows = await conn.execute_query_dict(
+        "SELECT u.id, u.username, u.display_name, u.profile_image, u.is_verified, "
+        "COUNT(*) OVER () AS total "
+        f"FROM users u JOIN user_follows f ON {join_clause} "
+        f"ORDER BY u.created_at DESC, u.id DESC LIMIT {limit_ph} OFFSET {offset_ph}",
+        [user_id, limit, offset],
+    )
+
+    total = rows[0]["total"] if rows else 0
+
     items = [
         UserBrief(
-            id=f.id,
-            username=f.username,
-            display_name=f.display_name,
-            profile_image=f.profile_image,
-            is_verified=f.is_verified,
+            id=row["id"],
+            username=row["username"],
+            display_name=row["display_name"],
+            profile_image=row["profile_image"],
+            is_verified=bool(row["is_verified"]),
         )
-        for f in following
+        for row in rows
     ]
-    
+
     return FollowerList(
         items=items,
         total=total,
@@ -281,23 +292,89 @@ async def get_following(
         has_more=(offset + limit) < total,
     )
 
+
+async def _fetch_user_stats(
+    user_id: int,
+    current_user_id: Optional[int] = None
+) -> dict:
+    """
+    Fetch follower/following/post counts and follow relationship flags
+    in a single query.
+
+    The naive version issues five separate round-trips; one SELECT with
+    scalar subqueries returns everything in one row.
+
+    Counts are served from the short-TTL Redis counter cache when warm;
+    the COUNT(*) subqueries only run on a cold cache and backfill it.
+
+    Note on user_follows columns: "users_id" is the follower,
+    "user_id" is the user being followed.
+    """
+    uid = int(user_id)
+
+    counts = await counters.get_user_counts(uid)
+
+    conn = Tortoise.get_connection("default")
+    is_postgres = conn.capabilities.dialect == "postgres"
+    params: list[int] = []
+
+    def bind(value: int) -> str:
+        """Append a bound parameter and return its placeholder."""
+        params.append(value)
+        return f"${len(params)}" if is_postgres else "?"
+
+    selects = []
+    if counts is None:
+        selects = [
+            f"(SELECT COUNT(*) FROM user_follows WHERE user_id = {bind(uid)}) AS follower_count",
+            f"(SELECT COUNT(*) FROM user_follows WHERE users_id = {bind(uid)}) AS following_count",
+            f"(SELECT COUNT(*) FROM posts WHERE author_id = {bind(uid)} AND NOT is_deleted) AS post_count",
+        ]
+
+    if current_user_id is not None and current_user_id != user_id:
+        cid = int(current_user_id)
+        selects.append(
+            f"EXISTS(SELECT 1 FROM user_follows WHERE users_id = {bind(cid)} AND user_id = {bind(uid)}) AS is_following"
+        )
+        selects.append(
+            f"EXISTS(SELECT 1 FROM user_follows WHERE users_id = {bind(uid)} AND user_id = {bind(cid)}) AS is_followed_by"
+        )
+
+    stats = {}
+    if selects:
+        rows = await conn.execute_query_dict("SELECT " + ", ".join(selects), params)
+        stats = rows[0]
+
+    if counts is None:
+        counts = {
+            "follower_count": stats["follower_count"],
+            "following_count": stats["following_count"],
+            "post_count": stats["post_count"],
+        }
+        await counters.set_user_counts(uid, **counts)
+
+    return {
+        **counts,
+        "is_following": bool(stats.get("is_following", False)),
+        "is_followed_by": bool(stats.get("is_followed_by", False)),
+    }
+
+
 async def _user_to_schema(
     user: User,
     current_user: Optional[User] = None
 ) -> UserOut:
     """Convert User to UserOut schema with computed fields."""
-    follower_count = await user.followers.all().count()
-    following_count = await user.following.all().count()
-    post_count = await user.posts.filter(is_deleted=False).count()
-    
-    # Check relationship with current user
-    is_following = False
-    is_followed_by = False
-    
-    if current_user and current_user.id != user.id:
-        is_following = await current_user.following.filter(id=user.id).exists()
-        is_followed_by = await user.following.filter(id=current_user.id).exists()
-    
+    stats = await _fetch_user_stats(
+        user.id,
+        current_user.id if current_user else None,
+    )
+    follower_count = stats["follower_count"]
+    following_count = stats["following_count"]
+    post_count = stats["post_count"]
+    is_following = stats["is_following"]
+    is_followed_by = stats["is_followed_by"]
+
     return UserOut(
         id=user.id,
         username=user.username,
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class ORMModel(BaseModel):
+    """
+    Base for schemas built from ORM objects.
+
+    One shared ConfigDict instead of a nested `class Config` per schema -
+    the nested form goes through pydantic v2's deprecation-compat path at
+    every model build.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,6 +1,34 @@
 from pydantic import BaseModel, EmailStr, Field, field_validator
 import re
 
+# Compiled once at import; validators run per request
+USERNAME_REGEX = re.compile(r"^[a-zA-Z0-9_]+$")
+
+
+def check_password_strength(v: str) -> str:
+    """
+    Validate password complexity in a single pass.
+
+    One loop with early exit instead of three any(...) scans - each
+    scan re-walked the whole string through a fresh generator.
+    """
+    has_upper = has_lower = has_digit = False
+    for c in v:
+        if not has_upper and c.isupper():
+            has_upper = True
+        elif not has_lower and c.islower():
+            has_lower = True
+        elif not has_digit and c.isdigit():
+            has_digit = True
+        if has_upper and has_lower and has_digit:
+            return v
+
+    if not has_upper:
+        raise ValueError("Password must contain at least one uppercase letter")
+    if not has_lower:
+        raise ValueError("Password must contain at least one lowercase letter")
+    raise ValueError("Password must contain at least one digit")
+
 
 class LoginRequest(BaseModel):
     email: EmailStr
@@ -24,7 +52,7 @@ class RegisterRequest(BaseModel):
     @classmethod
     def validate_username(cls, v: str) -> str:
         """Validate username format."""
-        if not re.match(r"^[a-zA-Z0-9_]+$", v):
+        if not USERNAME_REGEX.match(v):
             raise ValueError("Username can only contain letters, numbers, and underscores")
         if v.startswith("_") or v.endswith("_"):
             raise ValueError("Username cannot start or end with underscore")
@@ -34,13 +62,7 @@ class RegisterRequest(BaseModel):
     @classmethod
     def validate_password_strength(cls, v: str) -> str:
         """Validate password meets minimum requirements."""
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return check_password_strength(v)
 
 
 class TokenResponse(BaseModel):
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 from datetime import datetime
 
+from src.schemas._base import ORMModel
 from src.schemas.user import UserBrief
 from src.schemas.tag import TagOut
 
@@ -40,7 +41,7 @@ class PostUpdate(BaseModel):
             raise ValueError("Post body cannot be empty or whitespace only")
         return v
 
-class PostOut(BaseModel):
+class PostOut(ORMModel):
 
     id: int
     body: str
@@ -64,12 +65,9 @@ class PostOut(BaseModel):
     # Timestamps
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True  # Allow creating from ORM objects
 
 
-class PostBrief(BaseModel):
+class PostBrief(ORMModel):
     """
     Minimal post info for nested responses.
     
@@ -79,9 +77,6 @@ class PostBrief(BaseModel):
     body: str
     author: UserBrief
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class PostWithReplies(PostOut):
@@ -100,10 +95,15 @@ class PostList(BaseModel):
     Includes metadata for pagination UI.
     """
     items: list[PostOut]
-    total: int
+    # None when the caller opted out of the COUNT (include_total=false
+    # or cursor paging) - infinite-scroll UIs don't need it
+    total: Optional[int] = None
     limit: int
     offset: int
     has_more: bool
+    # Keyset cursor for the next page (preferred over offset for deep
+    # pagination); None when there are no further pages
+    next_cursor: Optional[str] = None
 
 
 class LikeResponse(BaseModel):
@@ -1,17 +1,20 @@
 from pydantic import BaseModel, Field, field_validator
+
+from src.schemas._base import ORMModel
 from datetime import datetime
+import re
+
+# Compiled once at import; validators run per request
+TAG_NAME_REGEX = re.compile(r"^[a-z0-9_]+$")
 
 
-class TagOut(BaseModel):
+class TagOut(ORMModel):
     """Basic tag response."""
     id: int
     name: str
-    
-    class Config:
-        from_attributes = True
 
 
-class TagWithCount(BaseModel):
+class TagWithCount(ORMModel):
     """
     Tag with post count.
     
@@ -20,9 +23,6 @@ class TagWithCount(BaseModel):
     id: int
     name: str
     post_count: int = 0
-    
-    class Config:
-        from_attributes = True
 
 
 class TrendingTag(BaseModel):
@@ -48,11 +48,9 @@ class TagCreate(BaseModel):
     @classmethod
     def normalize_tag_name(cls, v: str) -> str:
         """Normalize tag name to lowercase, no #, alphanumeric only."""
-        import re
-        
         name = v.lower().strip().lstrip("#")
         
-        if not re.match(r"^[a-z0-9_]+$", name):
+        if not TAG_NAME_REGEX.match(name):
             raise ValueError("Tag name can only contain letters, numbers, and underscores")
         
         return name
\ No newline at end of file
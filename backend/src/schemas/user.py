@@ -2,19 +2,19 @@ from pydantic import BaseModel, EmailStr, Field, field_validator
 from typing import Optional
 from datetime import datetime
 
+from src.schemas.auth import check_password_strength
+from src.schemas._base import ORMModel
 
-class UserBrief(BaseModel):
+
+class UserBrief(ORMModel):
     id: int
     username: str
     display_name: Optional[str] = None
     profile_image: Optional[str] = None
     is_verified: bool = False
-    
-    class Config:
-        from_attributes = True
 
 
-class UserOut(BaseModel):
+class UserOut(ORMModel):
     id: int
     username: str
     display_name: Optional[str] = None
@@ -32,9 +32,6 @@ class UserOut(BaseModel):
     # Relationship to current user (set based on requesting user)
     is_following: bool = False  # Does current user follow this user?
     is_followed_by: bool = False  # Does this user follow current user?
-    
-    class Config:
-        from_attributes = True
 
 
 class UserPrivate(UserOut):
@@ -67,13 +64,7 @@ class PasswordChange(BaseModel):
     @classmethod
     def validate_password_strength(cls, v: str) -> str:
         """Validate new password meets requirements."""
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return check_password_strength(v)
 
 
 class FollowResponse(BaseModel):
@@ -1,6 +1,9 @@
+import asyncio
 from typing import Optional
 from fastapi import HTTPException, status
+from tortoise import Tortoise
 from tortoise.exceptions import IntegrityError
+from tortoise.expressions import Q
 
 from src.models.user import User
 from src.core.security import (
@@ -16,6 +19,10 @@ from src.schemas.auth import RegisterRequest
 
 settings = get_settings()
 
+# Precomputed once - pydantic attribute access plus the multiply is
+# wasted work on every token issuance
+_ACCESS_EXPIRES_IN = settings.access_token_expire_minutes * 60
+
 
 class AuthService:
     """
@@ -38,21 +45,38 @@ class AuthService:
         Returns:
             User object if credentials valid, None otherwise
         """
-        user = await User.get_or_none(email=email.lower())
-        
-        if user is None:
+        # Raw lookup of just the columns login needs - skips tortoise's
+        # full-row materialization on the hottest read in the app
+        conn = Tortoise.get_connection("default")
+        if conn.capabilities.dialect == "postgres":
+            sql = "SELECT id, password_hash, is_active FROM users WHERE email = $1"
+        else:
+            sql = "SELECT id, password_hash, is_active FROM users WHERE email = ?"
+        # islower() is a single C scan with no allocation - the common
+        # case (clients send lowercase emails) skips the copy entirely
+        if not email.islower():
+            email = email.lower()
+        _, rows = await conn.execute_query(sql, [email])
+
+        if not rows:
             # Still hash to prevent timing attacks
             # (response time would differ if we skip hashing for non-existent users)
-            hash_password("dummy_password_for_timing")
+            await asyncio.to_thread(hash_password, "dummy_password_for_timing")
             return None
-        
-        if not user.is_active:
+
+        row = dict(rows[0])
+        # Deactivated accounts are refused before the bcrypt verify -
+        # no KDF spend on logins that can never succeed
+        if not row["is_active"]:
             return None
-        
-        if not verify_password(password, user.password_hash):
+
+        # bcrypt takes hundreds of ms at 12 rounds - run it in a worker
+        # thread so concurrent requests aren't serialized behind it
+        if not await asyncio.to_thread(verify_password, password, row["password_hash"]):
             return None
-        
-        return user
+
+        # Rehydrate a partial User (token issuance only needs the id)
+        return User._init_from_db(**row)
     
     async def register(self, data: RegisterRequest) -> User:
         """
@@ -67,27 +91,34 @@ class AuthService:
         Raises:
             HTTPException 409: If username or email already exists
         """
-        # Check for existing username
-        existing_username = await User.get_or_none(username=data.username.lower())
-        if existing_username:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Username already registered"
-            )
-        
-        # Check for existing email
-        existing_email = await User.get_or_none(email=data.email.lower())
-        if existing_email:
+        # RegisterRequest's validator already lowercases the username;
+        # EmailStr only normalizes the domain, so the local part may
+        # still need it
+        username = data.username
+        email = data.email if data.email.islower() else data.email.lower()
+
+        # One combined preflight instead of separate username and email
+        # lookups; the unique indexes (via IntegrityError below) remain
+        # the real guarantee against races
+        existing = await User.filter(
+            Q(username=username) | Q(email=email)
+        ).first()
+        if existing:
+            if existing.username == username:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Username already registered"
+                )
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Email already registered"
             )
-        
+
         try:
             user = await User.create(
-                username=data.username.lower(),
-                email=data.email.lower(),
-                password_hash=hash_password(data.password),
+                username=username,
+                email=email,
+                password_hash=await asyncio.to_thread(hash_password, data.password),
             )
             return user
         except IntegrityError:
@@ -114,7 +145,7 @@ class AuthService:
             "access_token": access_token,
             "refresh_token": refresh_token,
             "token_type": "bearer",
-            "expires_in": settings.access_token_expire_minutes * 60,  # Convert to seconds
+            "expires_in": _ACCESS_EXPIRES_IN,  # Seconds
         }
     
     async def refresh_access_token(self, refresh_token: str) -> dict:
@@ -164,7 +195,7 @@ class AuthService:
         return {
             "access_token": access_token,
             "token_type": "bearer",
-            "expires_in": settings.access_token_expire_minutes * 60,
+            "expires_in": _ACCESS_EXPIRES_IN,
         }
 
 
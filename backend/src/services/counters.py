@@ -0,0 +1,104 @@
+from typing import Optional
+from src.core.redis import get_redis
+
+# Redis key patterns
+def follower_count_key(user_id: int) -> str:
+    """Redis key for a user's follower count"""
+    return f"user:{user_id}:follower_count"
+
+def following_count_key(user_id: int) -> str:
+    """Redis key for a user's following count"""
+    return f"user:{user_id}:following_count"
+
+def post_count_key(user_id: int) -> str:
+    """Redis key for a user's post count"""
+    return f"user:{user_id}:post_count"
+
+
+# Short TTL: counters are a read-through cache over COUNT(*), so any
+# drift (missed increment, Redis restart) self-heals within a minute.
+COUNT_CACHE_TTL_SECONDS = 60
+
+# All helpers fail open: if Redis is unreachable, reads return None
+# (callers fall back to COUNT(*)) and writes become no-ops.
+
+
+async def get_user_counts(user_id: int) -> Optional[dict]:
+    """
+    Get cached follower/following/post counts for a user.
+
+    Returns a dict with all three counts, or None if any is missing
+    (callers should then run the real COUNT query and backfill).
+    """
+    try:
+        redis = await get_redis()
+        values = await redis.mget(
+            follower_count_key(user_id),
+            following_count_key(user_id),
+            post_count_key(user_id),
+        )
+    except Exception:
+        return None
+
+    if any(v is None for v in values):
+        return None
+
+    return {
+        "follower_count": int(values[0]),
+        "following_count": int(values[1]),
+        "post_count": int(values[2]),
+    }
+
+
+async def set_user_counts(
+    user_id: int,
+    follower_count: int,
+    following_count: int,
+    post_count: int,
+) -> None:
+    """Backfill the counter cache after a COUNT query (best effort)."""
+    try:
+        redis = await get_redis()
+        pipe = redis.pipeline()
+        pipe.set(follower_count_key(user_id), follower_count, ex=COUNT_CACHE_TTL_SECONDS)
+        pipe.set(following_count_key(user_id), following_count, ex=COUNT_CACHE_TTL_SECONDS)
+        pipe.set(post_count_key(user_id), post_count, ex=COUNT_CACHE_TTL_SECONDS)
+        await pipe.execute()
+    except Exception:
+        pass
+
+
+# EXISTS and INCRBY must be one atomic step: done as two commands, the
+# key can expire in between and INCRBY recreates it at `delta` with no
+# TTL - a wrong count that the TTL self-heal never reclaims.
+_ADJUST_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return false
+"""
+
+
+async def _adjust(key: str, delta: int) -> None:
+    """
+    INCR/DECR a counter key, but only if it already exists.
+
+    INCR on a missing key would create it at 0 and produce a wrong
+    count; a cold key is instead left for the next read to backfill.
+    """
+    try:
+        redis = await get_redis()
+        await redis.eval(_ADJUST_SCRIPT, 1, key, delta)
+    except Exception:
+        pass
+
+
+async def adjust_follow_counts(follower_id: int, followed_id: int, delta: int) -> None:
+    """Bump counters after a follow (+1) or unfollow (-1)."""
+    await _adjust(follower_count_key(followed_id), delta)
+    await _adjust(following_count_key(follower_id), delta)
+
+
+async def adjust_post_count(author_id: int, delta: int) -> None:
+    """Bump post counter after a post is created (+1) or deleted (-1)."""
+    await _adjust(post_count_key(author_id), delta)
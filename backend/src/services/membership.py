@@ -0,0 +1,133 @@
+from typing import Iterable, Optional
+from src.core.redis import get_redis
+
+# Redis key patterns
+def following_key(user_id: int) -> str:
+    """Redis key for the set of user ids this user follows"""
+    return f"user:{user_id}:following"
+
+def liked_posts_key(user_id: int) -> str:
+    """Redis key for the set of post ids this user has liked"""
+    return f"user:{user_id}:liked_posts"
+
+
+# A backfilled-but-empty set must stay distinguishable from a missing
+# key, so every mirrored set carries this placeholder member. Real
+# members are positive ids, so -1 can never collide.
+_SENTINEL = "-1"
+
+MEMBERSHIP_TTL_SECONDS = 24 * 60 * 60  # refreshed on every write
+
+# All helpers fail open: reads return None when the cache can't answer
+# (caller falls back to the DB) and writes become no-ops.
+
+
+async def _check(key: str, member: int) -> Optional[bool]:
+    """SISMEMBER against a mirrored set; None if the key isn't populated."""
+    try:
+        redis = await get_redis()
+        if not await redis.exists(key):
+            return None
+        return bool(await redis.sismember(key, member))
+    except Exception:
+        return None
+
+
+async def _backfill(key: str, members: Iterable[int]) -> None:
+    """Rebuild a mirrored set from the DB relation (best effort)."""
+    try:
+        redis = await get_redis()
+        pipe = redis.pipeline()
+        pipe.delete(key)
+        pipe.sadd(key, _SENTINEL, *members)
+        pipe.expire(key, MEMBERSHIP_TTL_SECONDS)
+        await pipe.execute()
+    except Exception:
+        pass
+
+
+# Warmth check and write must be one atomic step, and the check keys
+# off the sentinel, not bare EXISTS: if the set expires between the two
+# commands, SADD would create a one-member set (no sentinel, fresh TTL)
+# that get_following_ids happily serves as the complete follow list.
+_UPDATE_SCRIPT = """
+if redis.call('SISMEMBER', KEYS[1], ARGV[1]) == 1 then
+    if ARGV[2] == '1' then
+        redis.call('SADD', KEYS[1], ARGV[3])
+    else
+        redis.call('SREM', KEYS[1], ARGV[3])
+    end
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+    return 1
+end
+return 0
+"""
+
+
+async def _update(key: str, member: int, add: bool) -> None:
+    """Write-through a single membership change if the mirror is warm."""
+    try:
+        redis = await get_redis()
+        await redis.eval(
+            _UPDATE_SCRIPT,
+            1,
+            key,
+            _SENTINEL,
+            "1" if add else "0",
+            member,
+            MEMBERSHIP_TTL_SECONDS,
+        )
+    except Exception:
+        pass
+
+
+async def is_following_cached(user_id: int, target_id: int) -> Optional[bool]:
+    """O(1) follow check; None means cold cache (fall back to the DB)."""
+    return await _check(following_key(user_id), target_id)
+
+
+async def get_following_ids(user_id: int) -> Optional[set[int]]:
+    """
+    The full set of ids this user follows, from the mirror.
+
+    None means cold cache - the caller should load from the DB and
+    backfill. Saves the per-feed-request follow-graph query once warm.
+    """
+    try:
+        redis = await get_redis()
+        members = await redis.smembers(following_key(user_id))
+    except Exception:
+        return None
+
+    if not members:
+        return None
+    return {int(m) for m in members if m != _SENTINEL}
+
+
+async def backfill_following(user_id: int, followed_ids: Iterable[int]) -> None:
+    await _backfill(following_key(user_id), followed_ids)
+
+
+async def record_follow(user_id: int, target_id: int) -> None:
+    await _update(following_key(user_id), target_id, add=True)
+
+
+async def record_unfollow(user_id: int, target_id: int) -> None:
+    await _update(following_key(user_id), target_id, add=False)
+
+
+async def has_liked_cached(user_id: int, post_id: int) -> Optional[bool]:
+    """O(1) like check; None means cold cache (fall back to the DB)."""
+    return await _check(liked_posts_key(user_id), post_id)
+
+
+async def backfill_liked(user_id: int, post_ids: Iterable[int]) -> None:
+    await _backfill(liked_posts_key(user_id), post_ids)
+
+
+async def record_like(user_id: int, post_id: int) -> None:
+    await _update(liked_posts_key(user_id), post_id, add=True)
+
+
+async def record_unlike(user_id: int, post_id: int) -> None:
+    await _update(liked_posts_key(user_id), post_id, add=False)
@@ -1,7 +1,10 @@
+import base64
+import binascii
+from datetime import datetime
 from typing import Literal, Optional
 from fastapi import HTTPException, status
-from tortoise.expressions import Q
-from tortoise.functions import Count
+from tortoise import Tortoise
+from tortoise.expressions import F, Q
 
 from src.services.views import view_service
 from src.models.post import Post
@@ -11,6 +14,43 @@ from src.schemas.post import PostCreate, PostUpdate, PostOut, PostList
 from src.schemas.user import UserBrief
 from src.schemas.tag import TagOut
 from src.services.tags import extract_tag_names, get_or_create_tags
+from src.services import counters, membership
+
+
+def encode_cursor(post: Post) -> str:
+    """Encode a post's (created_at, id) position as an opaque cursor."""
+    raw = f"{post.created_at.isoformat()}|{post.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Optional[tuple[datetime, int]]:
+    """Decode a cursor back to (created_at, id); None if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at_iso, post_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at_iso), int(post_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
+def cursor_filter(cursor: str) -> Q:
+    """
+    Build the keyset predicate (created_at, id) < (cursor_ts, cursor_id).
+
+    OFFSET pagination scans and discards `offset` rows per page; with a
+    keyset the DB seeks straight to the cursor position on the
+    (created_at, id) ordering, so deep pages cost the same as page one.
+    """
+    decoded = decode_cursor(cursor)
+    if decoded is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid cursor"
+        )
+    cursor_ts, cursor_id = decoded
+    return Q(created_at__lt=cursor_ts) | Q(created_at=cursor_ts, id__lt=cursor_id)
+
+
 
 
 class PostService:
@@ -19,8 +59,8 @@ class PostService:
         self,
         data: PostCreate,
         author: User
-    ) -> Post:
-        
+    ) -> PostOut:
+
         # Validate parent post if this is a reply
         if data.parent_id:
             parent = await Post.get_or_none(id=data.parent_id, is_deleted=False)
@@ -48,15 +88,48 @@ class PostService:
         )
         
         # Extract and link tags
+        tags = []
         tag_names = extract_tag_names(data.body)
         if tag_names:
             tags = await get_or_create_tags(tag_names)
             await post.tags.add(*tags)
-        
-        # Reload with relationships for response
-        await post.fetch_related("author", "tags", "liked_by")
-        
-        return post
+
+        # Keep the denormalized counters on the parent/original in step
+        if data.parent_id:
+            await Post.filter(id=data.parent_id).update(
+                reply_count=F("reply_count") + 1
+            )
+        if data.repost_of_id:
+            await Post.filter(id=data.repost_of_id).update(
+                repost_count=F("repost_count") + 1
+            )
+
+        await counters.adjust_post_count(author.id, +1)
+
+        # Everything needed for the response is already in memory: the
+        # author is the authenticated user, the tags were just linked,
+        # and a brand-new post has no likes/replies/reposts. Building
+        # PostOut here avoids re-fetching the row we just wrote.
+        return PostOut(
+            id=post.id,
+            body=post.body,
+            author=UserBrief(
+                id=author.id,
+                username=author.username,
+                display_name=author.display_name,
+                profile_image=author.profile_image,
+                is_verified=author.is_verified,
+            ),
+            tags=[TagOut(id=t.id, name=t.name) for t in tags],
+            like_count=0,
+            reply_count=0,
+            repost_count=0,
+            is_liked=False,
+            parent_id=post.parent_id,
+            repost_of_id=post.repost_of_id,
+            created_at=post.created_at,
+            updated_at=post.updated_at,
+        )
     
     async def get_post(
         self,
@@ -73,10 +146,13 @@ class PostService:
         Returns:
             PostOut schema with all details
         """
+        # select_related folds the author into the main query as a JOIN;
+        # tags still need a prefetch (m2m). Engagement counts are plain
+        # columns now, so nothing else to compute.
         post = await Post.get_or_none(
             id=post_id,
             is_deleted=False
-        ).prefetch_related("author", "tags", "liked_by", "replies")
+        ).select_related("author").prefetch_related("tags")
         
         if not post:
             raise HTTPException(
@@ -86,6 +162,37 @@ class PostService:
         
         return await self._post_to_schema(post, current_user)
 
+    # Past this many skipped rows, fetching the page ids first and then
+    # the full rows by primary key (the "deferred join" pattern) beats a
+    # straight OFFSET: the skip scan walks the narrow (created_at, id)
+    # index instead of materializing the wide TEXT body for every
+    # discarded row. Below it, one round-trip wins.
+    DEFERRED_JOIN_OFFSET = 100
+
+    async def _fetch_page(self, query, count: int, offset: int) -> list[Post]:
+        """
+        Fetch `count` rows (with author/tags attached) starting at
+        `offset` from an already-filtered, already-ordered queryset.
+
+        Deep offsets go through the deferred join described above;
+        shallow ones take the direct path. Tortoise can't join against
+        its own subquery, so the deferred variant is two round-trips -
+        still far cheaper than dragging row bodies through the skip.
+        """
+        if offset < self.DEFERRED_JOIN_OFFSET:
+            return await query.select_related("author").prefetch_related(
+                "tags"
+            ).offset(offset).limit(count)
+
+        page_ids = await query.offset(offset).limit(count).values_list(
+            "id", flat=True
+        )
+        rows = await Post.filter(id__in=page_ids).select_related(
+            "author"
+        ).prefetch_related("tags")
+        by_id = {post.id: post for post in rows}
+        return [by_id[pk] for pk in page_ids if pk in by_id]
+
     async def list_posts(
         self,
         limit: int = 20,
@@ -94,10 +201,12 @@ class PostService:
         tags: Optional[list[str]] = None,
         current_user: Optional[User] = None,
         sort_by: Literal["recent", "popular"] = "recent",
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> PostList:
         """
         List posts with filtering and pagination.
-        
+
         Args:
             limit: Max posts to return
             offset: Number of posts to skip
@@ -105,48 +214,68 @@ class PostService:
             tags: Filter by tag name
             current_user: For is_liked status
             sort_by: "recent" (default) or "popular" (by likes, then recency)
-        
+            cursor: Keyset cursor from a previous page's next_cursor;
+                takes precedence over offset (only valid with "recent")
+            include_total: Run the COUNT(*) for `total`; cursor paging
+                skips it regardless since infinite scroll never shows it
+
         Returns:
             PostList with items and pagination info
         """
         query = Post.filter(is_deleted=False)
-        
+
         if author_id:
             query = query.filter(author_id=author_id)
-        
+
         if tags:
-            query = query.filter(tags__name__in=[t.lower() for t in tags])
-        
-        # Get total count for pagination
-        total = await query.count()
-        
+            # The router canonicalizes (lowercase, de-duped) before
+            # calling in, so this is a pass-through
+            query = query.filter(tags__name__in=tags)
+
+        use_keyset = cursor is not None and sort_by == "recent"
+
+        # The COUNT(*) is a full scan of the filtered set - only pay for
+        # it when the caller actually wants a total
+        total = None
+        if include_total and not use_keyset:
+            total = await query.count()
+
+        if use_keyset:
+            query = query.filter(cursor_filter(cursor))
+
         # Apply sorting
         if sort_by == "popular":
-            # Sort by like_count descending, then by created_at descending
-            query = query.annotate(
-                likes=Count("liked_by")
-            ).order_by("-likes", "-created_at")
+            # like_count is a real column now - no aggregate join needed
+            query = query.order_by("-like_count", "-created_at")
         else:
-            # Default: most recent first
-            query = query.order_by("-created_at")
-        
-        # Fetch posts with relationships
-        posts = await query.prefetch_related(
-            "author", "tags", "liked_by"
-        ).offset(offset).limit(limit)
-        
-        # Convert to schemas
-        items = [
-            await self._post_to_schema(post, current_user)
-            for post in posts
-        ]
-        
+            # Most recent first; id breaks created_at ties so the keyset
+            # ordering is total
+            query = query.order_by("-created_at", "-id")
+
+        # Fetch posts with relationships. Fetch one extra row to learn
+        # whether another page exists without a second COUNT.
+        if use_keyset:
+            posts = await query.select_related("author").prefetch_related(
+                "tags"
+            ).limit(limit + 1)
+        else:
+            posts = await self._fetch_page(query, limit + 1, offset)
+        has_more = len(posts) > limit
+        posts = posts[:limit]
+
+        items = await self._posts_to_schemas(posts, current_user)
+
         return PostList(
             items=items,
             total=total,
             limit=limit,
             offset=offset,
-            has_more=(offset + limit) < total,
+            has_more=has_more,
+            next_cursor=(
+                encode_cursor(posts[-1])
+                if has_more and posts and sort_by == "recent"
+                else None
+            ),
         )
     
     async def get_feed(
@@ -154,17 +283,28 @@ class PostService:
         user: User,
         limit: int = 20,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> PostList:
         """
         Get personalized feed for a user.
-        
+
         Algorithm:
         1. Get posts from followed users + own posts
         2. Sort: unviewed first, then by recency
         3. Never hide viewed posts, just deprioritize
-        """        
-        # Get IDs of users being followed + self
-        following_ids = await user.following.all().values_list("id", flat=True)
+
+        When a cursor is passed it replaces offset: the underlying
+        recency window resumes below the cursor position instead of
+        scanning past `offset` rows.
+        """
+        # Get IDs of users being followed + self. The Redis follow
+        # mirror (kept warm by the follow/unfollow endpoints) answers
+        # this without the per-request follow-graph query.
+        following_ids = await membership.get_following_ids(user.id)
+        if following_ids is None:
+            following_ids = await user.following.all().values_list("id", flat=True)
+            await membership.backfill_following(user.id, following_ids)
         following_ids = list(following_ids) + [user.id]  # Include own posts
         
         if not following_ids:
@@ -176,20 +316,38 @@ class PostService:
                 has_more=False,
             )
         
-        # Get viewed post IDs from Redis
-        viewed_post_ids = await view_service.get_viewed_posts(user.id)
-        
         # Build query
         query = Post.filter(
             is_deleted=False,
             author_id__in=following_ids,
         )
-        
-        total = await query.count()
-        
-        posts = await query.prefetch_related(
-            "author", "tags", "liked_by"
-        ).order_by("-created_at").offset(offset).limit(limit * 2) 
+
+        # Cursor paging is infinite scroll - skip the COUNT scan there
+        total = None
+        if include_total and cursor is None:
+            total = await query.count()
+
+        if cursor is not None:
+            query = query.filter(cursor_filter(cursor))
+            offset = 0
+
+        # Fetch one extra row to learn whether another page exists. The
+        # page is cut by pure recency BEFORE the deprioritization sort:
+        # re-sorting only within the emitted page means a viewed post is
+        # pushed down, never out - so the keyset cursor (oldest row of
+        # the recency window) can't skip past it.
+        posts = await self._fetch_page(
+            query.order_by("-created_at", "-id"), limit + 1, offset
+        )
+        window_has_more = len(posts) > limit
+        posts = posts[:limit]
+
+        # Viewed flags for just this window - one SMISMEMBER instead of
+        # pulling the user's entire view history out of Redis
+        viewed_post_ids = await view_service.viewed_subset(
+            user.id, [post.id for post in posts]
+        )
+
         # Sort: unviewed first, then by recency
         def sort_key(post):
             is_viewed = post.id in viewed_post_ids
@@ -202,17 +360,27 @@ class PostService:
                 -post.created_at.timestamp(),  # Recency 
             )
         
-        sorted_posts = sorted(posts, key=sort_key)[:limit]
-        
-        # Convert to schemas
-        items = [await self._post_to_schema(post, user) for post in sorted_posts]
-        
+        sorted_posts = sorted(posts, key=sort_key)
+
+        items = await self._posts_to_schemas(sorted_posts, user)
+
+        if total is not None:
+            has_more = (offset + limit) < total
+        else:
+            has_more = window_has_more
+        # posts is still in recency order, so its last element is the
+        # oldest row emitted this page - the next page resumes below it
+        next_cursor = None
+        if has_more and posts:
+            next_cursor = encode_cursor(posts[-1])
+
         return PostList(
             items=items,
             total=total,
             limit=limit,
             offset=offset,
-            has_more=(offset + limit) < total,
+            has_more=has_more,
+            next_cursor=next_cursor,
         )
     
     async def update_post(
@@ -244,25 +412,58 @@ class PostService:
         
         # Update fields that were provided
         update_data = data.model_dump(exclude_unset=True)
-        
+
+        tags = None
         if "body" in update_data:
             # Re-extract tags from new body
-            old_tags = await post.tags.all()
             await post.tags.clear()
-            
+
+            tags = []
             new_tag_names = extract_tag_names(update_data["body"])
             if new_tag_names:
-                new_tags = await get_or_create_tags(new_tag_names)
-                await post.tags.add(*new_tags)
-        
+                tags = await get_or_create_tags(new_tag_names)
+                await post.tags.add(*tags)
+
         # Apply updates
         for field, value in update_data.items():
             setattr(post, field, value)
-        
+
         await post.save()
-        await post.fetch_related("author", "tags", "liked_by")
-        
-        return await self._post_to_schema(post, current_user)
+
+        # Everything the response needs is already in memory: the
+        # author is current_user (ownership was just enforced), the
+        # tags were just linked, and the counters live on the row -
+        # no fetch_related round-trips
+        if tags is None:
+            tags = await post.tags.all()
+
+        is_liked = False
+        cached = await membership.has_liked_cached(current_user.id, post.id)
+        if cached is None:
+            is_liked = await self._has_liked_db(current_user.id, post.id)
+        else:
+            is_liked = cached
+
+        return PostOut(
+            id=post.id,
+            body=post.body,
+            author=UserBrief(
+                id=current_user.id,
+                username=current_user.username,
+                display_name=current_user.display_name,
+                profile_image=current_user.profile_image,
+                is_verified=current_user.is_verified,
+            ),
+            tags=[TagOut(id=t.id, name=t.name) for t in tags],
+            like_count=post.like_count,
+            reply_count=post.reply_count,
+            repost_count=post.repost_count,
+            is_liked=is_liked,
+            parent_id=post.parent_id,
+            repost_of_id=post.repost_of_id,
+            created_at=post.created_at,
+            updated_at=post.updated_at,
+        )
     
     async def delete_post(
         self,
@@ -292,7 +493,90 @@ class PostService:
         # Soft delete
         post.is_deleted = True
         await post.save()
+
+        if post.parent_id:
+            await Post.filter(id=post.parent_id).update(
+                reply_count=F("reply_count") - 1
+            )
+        if post.repost_of_id:
+            await Post.filter(id=post.repost_of_id).update(
+                repost_count=F("repost_count") - 1
+            )
+
+        await counters.adjust_post_count(post.author_id, -1)
     
+    # -- Like operations ---------------------------------------------
+    # These talk to the post_likes through table directly: the ORM path
+    # prefetched every liker's full user row just to add/remove one
+    # membership and count. Ids are ints, so they're inlined to keep
+    # the statements dialect-neutral.
+
+    async def _ensure_post_exists(self, post_id: int) -> None:
+        if not await Post.filter(id=post_id, is_deleted=False).exists():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Post not found"
+            )
+
+    async def _has_liked_db(self, user_id: int, post_id: int) -> bool:
+        conn = Tortoise.get_connection("default")
+        if conn.capabilities.dialect == "postgres":
+            sql = "SELECT 1 FROM post_likes WHERE user_id = $1 AND posts_id = $2 LIMIT 1"
+        else:
+            sql = "SELECT 1 FROM post_likes WHERE user_id = ? AND posts_id = ? LIMIT 1"
+        _, rows = await conn.execute_query(sql, [user_id, post_id])
+        return bool(rows)
+
+    async def _insert_like(self, user_id: int, post_id: int) -> bool:
+        """Insert the membership row; True if it was actually new."""
+        conn = Tortoise.get_connection("default")
+        if conn.capabilities.dialect == "postgres":
+            sql = (
+                "INSERT INTO post_likes (posts_id, user_id) VALUES ($1, $2) "
+                "ON CONFLICT DO NOTHING"
+            )
+        else:
+            sql = "INSERT OR IGNORE INTO post_likes (posts_id, user_id) VALUES (?, ?)"
+        affected, _ = await conn.execute_query(sql, [post_id, user_id])
+        return bool(affected)
+
+    async def _delete_like(self, user_id: int, post_id: int) -> bool:
+        """Delete the membership row; True if one existed."""
+        conn = Tortoise.get_connection("default")
+        if conn.capabilities.dialect == "postgres":
+            sql = "DELETE FROM post_likes WHERE user_id = $1 AND posts_id = $2"
+        else:
+            sql = "DELETE FROM post_likes WHERE user_id = ? AND posts_id = ?"
+        affected, _ = await conn.execute_query(sql, [user_id, post_id])
+        return bool(affected)
+
+    async def _like_count(self, post_id: int) -> int:
+        """Read the denormalized counter column."""
+        counts = await Post.filter(id=post_id).values_list("like_count", flat=True)
+        return counts[0] if counts else 0
+
+    async def _bump_like_count(self, post_id: int, delta: int) -> int:
+        """
+        Apply a counter delta and read the result in one statement.
+
+        RETURNING (Postgres, SQLite >= 3.35) folds the follow-up SELECT
+        into the UPDATE, so responding with the fresh count costs no
+        extra round-trip.
+        """
+        conn = Tortoise.get_connection("default")
+        if conn.capabilities.dialect == "postgres":
+            sql = (
+                "UPDATE posts SET like_count = like_count + $1 "
+                "WHERE id = $2 RETURNING like_count"
+            )
+        else:
+            sql = (
+                "UPDATE posts SET like_count = like_count + ? "
+                "WHERE id = ? RETURNING like_count"
+            )
+        _, rows = await conn.execute_query(sql, [delta, post_id])
+        return rows[0]["like_count"] if rows else 0
+
     async def like_post(
         self,
         post_id: int,
@@ -300,32 +584,32 @@ class PostService:
     ) -> dict:
         """
         Like a post.
-        
+
         Returns current like status and count.
         """
-        post = await Post.get_or_none(
-            id=post_id, is_deleted=False
-        ).prefetch_related("liked_by")
-        
-        if not post:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Post not found"
-            )
-        
-        # Check if already liked
-        already_liked = await post.liked_by.filter(id=user.id).exists()
-        
+        await self._ensure_post_exists(post_id)
+
+        # Check if already liked (Redis mirror first, DB on cold cache)
+        already_liked = await membership.has_liked_cached(user.id, post_id)
+        if already_liked is None:
+            already_liked = await self._has_liked_db(user.id, post_id)
+
+        like_count = None
         if not already_liked:
-            await post.liked_by.add(user)
-        
-        like_count = await post.liked_by.all().count()
-        
+            # The affected-rows check (not the cache) guards the counter
+            # bump, so a racing double-like can't inflate it
+            if await self._insert_like(user.id, post_id):
+                like_count = await self._bump_like_count(post_id, +1)
+            await membership.record_like(user.id, post_id)
+
+        if like_count is None:
+            like_count = await self._like_count(post_id)
+
         return {
             "liked": True,
             "like_count": like_count
         }
-    
+
     async def unlike_post(
         self,
         post_id: int,
@@ -334,26 +618,19 @@ class PostService:
         """
         Remove like from a post.
         """
-        post = await Post.get_or_none(
-            id=post_id, is_deleted=False
-        ).prefetch_related("liked_by")
-        
-        if not post:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Post not found"
-            )
-        
-        # Remove like if exists
-        await post.liked_by.remove(user)
-        
-        like_count = await post.liked_by.all().count()
-        
+        await self._ensure_post_exists(post_id)
+
+        if await self._delete_like(user.id, post_id):
+            like_count = await self._bump_like_count(post_id, -1)
+        else:
+            like_count = await self._like_count(post_id)
+        await membership.record_unlike(user.id, post_id)
+
         return {
             "liked": False,
             "like_count": like_count
         }
-    
+
     async def toggle_like(
         self,
         post_id: int,
@@ -361,58 +638,131 @@ class PostService:
     ) -> dict:
         """
         Toggle like status on a post.
-        
+
         More convenient for frontends - single endpoint handles both.
         """
-        post = await Post.get_or_none(
-            id=post_id, is_deleted=False
-        ).prefetch_related("liked_by")
-        
-        if not post:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Post not found"
-            )
-        
+        await self._ensure_post_exists(post_id)
+
         # Check current status and toggle
-        is_liked = await post.liked_by.filter(id=user.id).exists()
-        
+        is_liked = await membership.has_liked_cached(user.id, post_id)
+        if is_liked is None:
+            is_liked = await self._has_liked_db(user.id, post_id)
+
+        like_count = None
         if is_liked:
-            await post.liked_by.remove(user)
+            if await self._delete_like(user.id, post_id):
+                like_count = await self._bump_like_count(post_id, -1)
+            await membership.record_unlike(user.id, post_id)
         else:
-            await post.liked_by.add(user)
-        
-        like_count = await post.liked_by.all().count()
-        
+            if await self._insert_like(user.id, post_id):
+                like_count = await self._bump_like_count(post_id, +1)
+            await membership.record_like(user.id, post_id)
+
+        if like_count is None:
+            like_count = await self._like_count(post_id)
+
         return {
             "liked": not is_liked,
             "like_count": like_count
         }
     
     
+    async def _liked_post_ids(
+        self,
+        current_user: Optional[User],
+        posts: list[Post],
+    ) -> set[int]:
+        """
+        Which of the given posts the user has liked - one query.
+
+        Reads the post_likes through table directly; the ORM spelling
+        (liked_by__id=...) joined back through posts for no reason.
+        """
+        if not current_user or not posts:
+            return set()
+
+        post_ids = [post.id for post in posts]
+        conn = Tortoise.get_connection("default")
+        if conn.capabilities.dialect == "postgres":
+            # asyncpg binds the whole id list as one array parameter
+            sql = "SELECT posts_id FROM post_likes WHERE user_id = $1 AND posts_id = ANY($2)"
+            params = [current_user.id, post_ids]
+        else:
+            placeholders = ", ".join("?" for _ in post_ids)
+            sql = (
+                "SELECT posts_id FROM post_likes "
+                f"WHERE user_id = ? AND posts_id IN ({placeholders})"
+            )
+            params = [current_user.id, *post_ids]
+        _, rows = await conn.execute_query(sql, params)
+        return {row["posts_id"] for row in rows}
+
+    async def _posts_to_schemas(
+        self,
+        posts: list[Post],
+        current_user: Optional[User],
+    ) -> list[PostOut]:
+        """
+        Convert a whole page of posts to schemas in one pass.
+
+        One query answers is_liked for every row (_liked_post_ids); the
+        counts are denormalized columns and the author/tags rode along
+        with the page fetch, so the loop itself is pure Python with no
+        awaits. model_construct skips re-validating values that came
+        straight from our own queries.
+        """
+        liked_ids = await self._liked_post_ids(current_user, posts)
+        items = []
+        for post in posts:
+            author = post.author
+            items.append(
+                PostOut.model_construct(
+                    id=post.id,
+                    body=post.body,
+                    author=UserBrief.model_construct(
+                        id=author.id,
+                        username=author.username,
+                        display_name=author.display_name,
+                        profile_image=author.profile_image,
+                        is_verified=author.is_verified,
+                    ),
+                    tags=[
+                        TagOut.model_construct(id=t.id, name=t.name)
+                        for t in post.tags
+                    ],
+                    like_count=post.like_count,
+                    reply_count=post.reply_count,
+                    repost_count=post.repost_count,
+                    is_liked=post.id in liked_ids,
+                    parent_id=post.parent_id,
+                    repost_of_id=post.repost_of_id,
+                    created_at=post.created_at,
+                    updated_at=post.updated_at,
+                )
+            )
+        return items
+
     async def _post_to_schema(
         self,
         post: Post,
-        current_user: Optional[User] = None
+        current_user: Optional[User] = None,
     ) -> PostOut:
         """
-        Convert Post ORM object to PostOut schema.
-        
-        Computes:
-        - like_count
-        - reply_count  
-        - repost_count
-        - is_liked (for current user)
+        Convert a single Post ORM object to PostOut schema.
+
+        Used for single-item reads (get_post); list endpoints go through
+        the batched _posts_to_schemas instead. Engagement counts are
+        denormalized columns on the row itself, so only is_liked needs
+        a lookup.
         """
-        # Get counts
-        like_count = await post.liked_by.all().count()
-        reply_count = await Post.filter(parent_id=post.id, is_deleted=False).count()
-        repost_count = await Post.filter(repost_of_id=post.id, is_deleted=False).count()
-        
         # Check if current user liked this post
         is_liked = False
         if current_user:
-            is_liked = await post.liked_by.filter(id=current_user.id).exists()
+            cached = await membership.has_liked_cached(current_user.id, post.id)
+            if cached is None:
+                is_liked = await self._has_liked_db(current_user.id, post.id)
+            else:
+                is_liked = cached
         
         # Build author brief
         author = await post.author  # May already be prefetched
@@ -432,9 +782,9 @@ class PostService:
             body=post.body,
             author=author_brief,
             tags=tags,
-            like_count=like_count,
-            reply_count=reply_count,
-            repost_count=repost_count,
+            like_count=post.like_count,
+            reply_count=post.reply_count,
+            repost_count=post.repost_count,
             is_liked=is_liked,
             parent_id=post.parent_id,
             repost_of_id=post.repost_of_id,
@@ -1,11 +1,45 @@
+import json
 import re
-from typing import Set, List
+from typing import Optional, Set, List
+from tortoise import Tortoise
 from tortoise.functions import Count
 
+from src.core.redis import get_redis
 from src.models.tag import Tag
 from src.schemas.tag import TagWithCount
 
-HASHTAG_REGEX = re.compile(r"#(\w+)", re.IGNORECASE)
+# Trending data is global and tolerates staleness, so a short-TTL cache
+# turns the group-by scan into one shared computation per minute
+TRENDING_CACHE_TTL_SECONDS = 60
+
+
+async def _cached_trending(key: str) -> Optional[List[TagWithCount]]:
+    """Fetch a cached trending payload; None on miss or Redis trouble."""
+    try:
+        redis = await get_redis()
+        payload = await redis.get(key)
+    except Exception:
+        return None
+    if payload is None:
+        return None
+    return [TagWithCount.model_construct(**row) for row in json.loads(payload)]
+
+
+async def _store_trending(
+    key: str, tags: List[TagWithCount], ttl: int = TRENDING_CACHE_TTL_SECONDS
+) -> None:
+    """Cache a trending payload (best effort)."""
+    try:
+        redis = await get_redis()
+        await redis.setex(
+            key, ttl, json.dumps([tag.model_dump() for tag in tags])
+        )
+    except Exception:
+        pass
+
+# No IGNORECASE: \w already matches both cases and the names get
+# lowercased anyway
+HASHTAG_REGEX = re.compile(r"#(\w+)")
 
 
 def extract_tag_names(text: str) -> Set[str]:
@@ -22,19 +56,22 @@ def extract_tag_names(text: str) -> Set[str]:
         extract_tag_names("Learning #Python and #FastAPI!")
         # Returns: {"python", "fastapi"}
     """
-    # findall returns list of captured groups (the part in parentheses)
-    # So "#Python" returns "Python", not "#Python"
-    matches = HASHTAG_REGEX.findall(text)
-    
-    # Normalize to lowercase and return as set (removes duplicates)
-    return {match.lower() for match in matches}
+    # Most bodies have no hashtag at all - skip the regex entirely
+    if "#" not in text:
+        return set()
+
+    # finditer streams matches straight into the set comprehension
+    # (findall would materialize an intermediate list first); the
+    # captured group is the name without "#"
+    return {m.group(1).lower() for m in HASHTAG_REGEX.finditer(text)}
 
 
 async def get_or_create_tags(tag_names: Set[str]) -> List[Tag]:
     """
     Get existing tags or create new ones.
-    
-    Uses Tortoise's get_or_create for atomic operation.
+
+    Bulk upsert: the unique index on name makes the conflict-ignoring
+    insert safe under concurrent creates.
     
     Args:
         tag_names: Set of tag names to get/create
@@ -42,17 +79,17 @@ async def get_or_create_tags(tag_names: Set[str]) -> List[Tag]:
     Returns:
         List of Tag objects
     """
-    tags = []
-    
-    for name in tag_names:
-        # get_or_create returns (object, created_bool)
-        tag, created = await Tag.get_or_create(
-            name=name,
-            defaults={"name": name}  # Values to use if creating
-        )
-        tags.append(tag)
-    
-    return tags
+    if not tag_names:
+        return []
+
+    # One INSERT that skips names already present, then one SELECT for
+    # the full set - two queries total instead of get_or_create's
+    # SELECT + maybe-INSERT per tag
+    await Tag.bulk_create(
+        [Tag(name=name) for name in tag_names],
+        ignore_conflicts=True,
+    )
+    return await Tag.filter(name__in=tag_names)
 
 
 async def get_trending_tags(limit: int = 10) -> List[TagWithCount]:
@@ -69,21 +106,33 @@ async def get_trending_tags(limit: int = 10) -> List[TagWithCount]:
     Returns:
         List of tags with post counts
     """
-    # Annotate adds a computed column to the query
-    # Count("posts") counts the related posts for each tag
-    tags = await Tag.annotate(
-        post_count=Count("posts")
-    ).order_by("-post_count").limit(limit)
-    
-    # Convert to schema
-    return [
-        TagWithCount(
-            id=tag.id,
-            name=tag.name,
-            post_count=tag.post_count
+    cache_key = f"trending:tags:{int(limit)}"
+    cached = await _cached_trending(cache_key)
+    if cached is not None:
+        return cached
+
+    # Raw aggregate - this is a pure read of three columns, so skip
+    # tortoise's per-row Tag materialization and annotate machinery
+    conn = Tortoise.get_connection("default")
+    _, rows = await conn.execute_query(
+        "SELECT t.id, t.name, COUNT(pt.posts_id) AS post_count "
+        "FROM tags t "
+        "LEFT JOIN post_tags pt ON pt.tag_id = t.id "
+        "GROUP BY t.id, t.name "
+        f"ORDER BY post_count DESC LIMIT {int(limit)}"
+    )
+
+    # model_construct: rows came straight from our own query
+    tags = [
+        TagWithCount.model_construct(
+            id=row["id"],
+            name=row["name"],
+            post_count=row["post_count"],
         )
-        for tag in tags
+        for row in rows
     ]
+    await _store_trending(cache_key, tags)
+    return tags
 
 
 async def get_trending_tags_timewindow(
@@ -99,9 +148,20 @@ async def get_trending_tags_timewindow(
     For now, this is a simplified version.
     """
     from datetime import datetime, timedelta, timezone
-    
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-    
+
+    # Truncate the cutoff to the hour so every request within the same
+    # hour shares one cache entry (and one identical query)
+    cutoff = (
+        datetime.now(timezone.utc) - timedelta(hours=hours)
+    ).replace(minute=0, second=0, microsecond=0)
+
+    cache_key = (
+        f"trending:tags:{int(hours)}h:{int(cutoff.timestamp())}:{int(limit)}"
+    )
+    cached = await _cached_trending(cache_key)
+    if cached is not None:
+        return cached
+
     # This filters posts by created_at, then counts
     # In production, you might want a materialized view or cache
     tags = await Tag.annotate(
@@ -110,7 +170,7 @@ async def get_trending_tags_timewindow(
         post_count__gt=0  # Only tags with recent posts
     ).order_by("-post_count").limit(limit)
     
-    return [
+    result = [
         TagWithCount(
             id=tag.id,
             name=tag.name,
@@ -118,6 +178,9 @@ async def get_trending_tags_timewindow(
         )
         for tag in tags
     ]
+    # Hour-bucketed key: the entry can outlive the minute-scale TTL
+    await _store_trending(cache_key, result, ttl=60 * 60)
+    return result
 
 
 async def search_tags(query: str, limit: int = 10) -> List[Tag]:
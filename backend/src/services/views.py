@@ -1,23 +1,34 @@
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
+from tortoise import Tortoise
 from src.core.redis import get_redis
-from src.models.user import User
-from src.models.post import Post
 
 # Redis key patterns
 def user_views_key(user_id: int) -> str:
     """Redis key for user's viewed posts"""
     return f"user:{user_id}:viewed_posts"
 
-def pending_views_key() -> str:
-    """Redis key for views pending DB flush"""
-    return "pending_views"
+# Stream of views pending DB flush - constant, so no per-call helper
+PENDING_VIEWS_KEY = "pending_views"
 
 
 class ViewService:
     VIEW_EXPIRY_SECONDS = 7 * 24 * 60 * 60 # 7 days
-    
+
+    # Safety cap on the pending stream so a stalled flush job can't grow
+    # Redis without bound (approximate trim is near-free on XADD)
+    PENDING_STREAM_MAXLEN = 1_000_000
+
+    # Once the pending stream is this deep, kick off a flush immediately
+    # instead of waiting for the periodic job - fits flush frequency to
+    # actual write load
+    FLUSH_THRESHOLD = 10_000
+
+    def __init__(self) -> None:
+        self._flush_task: Optional[asyncio.Task] = None
+
+
     async def mark_viewed(self, user_id: int, post_ids: list[int]) -> None:
         """
         Mark posts as viewed by user.
@@ -30,19 +41,33 @@ class ViewService:
         pipe = redis.pipeline()
         
         user_key = user_views_key(user_id)
-        timestamp = datetime.utcnow().timestamp()
-        
+
+        # Add to user's viewed set (for filtering feed)
+        pipe.sadd(user_key, *post_ids)
+
+        # Queue for DB flush - stream entry IDs carry the timestamp, so
+        # no float formatting/parsing round-trip per view
         for post_id in post_ids:
-            # Add to user's viewed set (for filtering feed)
-            pipe.sadd(user_key, post_id)
-            
-            # Queue for DB flush: "user_id:post_id:timestamp"
-            pipe.sadd(pending_views_key(), f"{user_id}:{post_id}:{timestamp}")
-        
+            pipe.xadd(
+                PENDING_VIEWS_KEY,
+                {"u": user_id, "p": post_id},
+                maxlen=self.PENDING_STREAM_MAXLEN,
+                approximate=True,
+            )
+
         # Set/refresh expiry on user's viewed set
         pipe.expire(user_key, self.VIEW_EXPIRY_SECONDS)
-        
-        await pipe.execute()
+
+        # Piggyback the queue depth on the same round-trip
+        pipe.xlen(PENDING_VIEWS_KEY)
+
+        results = await pipe.execute()
+
+        pending_depth = results[-1]
+        if pending_depth > self.FLUSH_THRESHOLD and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self.flush_to_db())
     
     async def has_viewed(self, user_id: int, post_id: int) -> bool:
         """Check if user has viewed a post (Redis only, fast)"""
@@ -50,58 +75,101 @@ class ViewService:
         return await redis.sismember(user_views_key(user_id), post_id)
     
     async def get_viewed_posts(self, user_id: int) -> set[int]:
-        """Get all post IDs viewed by user from Redis"""
+        """
+        Get all post IDs viewed by user from Redis.
+
+        Ships the full view history - keep this for admin/debug use and
+        prefer viewed_subset on request paths.
+        """
         redis = await get_redis()
         viewed = await redis.smembers(user_views_key(user_id))
         return {int(post_id) for post_id in viewed}
-    
+
+    async def viewed_subset(self, user_id: int, post_ids: list[int]) -> set[int]:
+        """
+        Which of the given posts has the user viewed.
+
+        One SMISMEMBER - O(len(post_ids)) regardless of how large the
+        user's view history is. Degrades to "nothing viewed" if Redis
+        is unavailable.
+        """
+        if not post_ids:
+            return set()
+
+        try:
+            redis = await get_redis()
+            flags = await redis.smismember(user_views_key(user_id), post_ids)
+        except Exception:
+            return set()
+
+        return {pid for pid, seen in zip(post_ids, flags) if seen}
+
     async def filter_unviewed(self, user_id: int, post_ids: list[int]) -> list[int]:
         """Filter list to only unviewed posts"""
         if not post_ids:
             return []
-        
-        viewed = await self.get_viewed_posts(user_id)
+
+        viewed = await self.viewed_subset(user_id, post_ids)
         return [pid for pid in post_ids if pid not in viewed]
     
+    # How many pending views to read per Redis round-trip during a flush
+    FLUSH_BATCH_SIZE = 1000
+
     async def flush_to_db(self) -> int:
         """
         Flush pending views from Redis to PostgreSQL.
         Called by background job every 5 minutes.
         Returns number of views flushed.
+
+        Reads the pending stream in batches and XDELs only the entries
+        it has persisted, so views arriving mid-flush (which get larger
+        stream IDs) are never dropped.
         """
         redis = await get_redis()
-        
-        pending = await redis.smembers(pending_views_key())
-        if not pending:
-            return 0
-        
-        from src.models.post_view import PostView  # Import here to avoid circular
-        
-        views_to_create = []
-        for item in pending:
-            try:
-                user_id, post_id, timestamp = item.split(":")
-                views_to_create.append(
-                    PostView(
-                        user_id=int(user_id),
-                        post_id=int(post_id),
-                        viewed_at=datetime.fromtimestamp(float(timestamp)),
-                    )
-                )
-            except (ValueError, TypeError):
-                continue
-        
-        if views_to_create:
-            # Bulk insert, ignore duplicates
-            await PostView.bulk_create(
-                views_to_create,
-                ignore_conflicts=True,
+
+        conn = Tortoise.get_connection("default")
+        # Raw batched INSERT - building a tortoise PostView per pending
+        # row just to throw it at bulk_create is pure object-allocation
+        # overhead at this volume
+        if conn.capabilities.dialect == "postgres":
+            insert_sql = (
+                "INSERT INTO post_views (user_id, post_id, viewed_at) "
+                "VALUES ($1, $2, to_timestamp($3)) ON CONFLICT DO NOTHING"
             )
-        
-        # Clear pending set
-        await redis.delete(pending_views_key())
-        
-        return len(views_to_create)
+        else:
+            insert_sql = (
+                "INSERT OR IGNORE INTO post_views (user_id, post_id, viewed_at) "
+                "VALUES (?, ?, ?)"
+            )
+
+        flushed = 0
+        while True:
+            entries = await redis.xrange(
+                PENDING_VIEWS_KEY, "-", "+", count=self.FLUSH_BATCH_SIZE
+            )
+            if not entries:
+                break
+
+            rows = []
+            for entry_id, fields in entries:
+                try:
+                    # Entry IDs are "<unix-ms>-<seq>"
+                    viewed_ms = int(entry_id.split("-", 1)[0])
+                    if conn.capabilities.dialect == "postgres":
+                        viewed_at = viewed_ms / 1000
+                    else:
+                        viewed_at = datetime.fromtimestamp(viewed_ms / 1000).isoformat(" ")
+                    rows.append((int(fields["u"]), int(fields["p"]), viewed_at))
+                except (KeyError, ValueError, TypeError):
+                    continue
+
+            if rows:
+                await conn.execute_many(insert_sql, rows)
+                flushed += len(rows)
+
+            await redis.xdel(PENDING_VIEWS_KEY, *(eid for eid, _ in entries))
+
+        return flushed
 
 
 view_service = ViewService()
\ No newline at end of file
@@ -1,14 +1,41 @@
 import asyncio
+import logging
+
 from src.services.views import view_service
 
+logger = logging.getLogger(__name__)
+
+# Bounds for the adaptive polling interval
+MIN_INTERVAL_SECONDS = 30
+MAX_INTERVAL_SECONDS = 600
+BASE_INTERVAL_SECONDS = 300
+
+
 async def flush_views_job():
-    """Background job to flush views to DB every 5 minutes"""
+    """
+    Background job that flushes pending views to the DB.
+
+    The interval adapts to queue depth: draining full batches halves it,
+    idle polls (and Redis errors) back it off, bounded to [30s, 600s].
+    Threshold-triggered flushes in mark_viewed handle bursts between
+    polls; this loop is the drain-everything fallback.
+    """
+    interval = BASE_INTERVAL_SECONDS
     while True:
         try:
             count = await view_service.flush_to_db()
             if count > 0:
-                print(f"Flushed {count} views to database")
-        except Exception as e:
-            print(f"Error flushing views: {e}")
-        
-        await asyncio.sleep(300)  # 5 minutes
\ No newline at end of file
+                logger.info("Flushed %d views to database", count)
+
+            if count >= view_service.FLUSH_BATCH_SIZE:
+                interval = max(MIN_INTERVAL_SECONDS, interval // 2)
+            elif count == 0:
+                interval = min(MAX_INTERVAL_SECONDS, interval * 2)
+        except asyncio.CancelledError:
+            # Cooperative shutdown from lifespan's task.cancel()
+            raise
+        except Exception:
+            logger.exception("Error flushing views")
+            interval = min(MAX_INTERVAL_SECONDS, interval * 2)
+
+        await asyncio.sleep(interval)
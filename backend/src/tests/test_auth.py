@@ -2,7 +2,11 @@ import pytest
 from httpx import AsyncClient
 
 from src.models.user import User
-from src.core.security import verify_password
+from src.core.security import hash_password
+
+# Hashed once per module import; every test that needs a canned
+# password/hash pair reuses it instead of re-running the KDF
+_TEST_HASH = hash_password("TestPassword123")
 
 
 class TestRegistration:
@@ -45,15 +49,21 @@ class TestRegistration:
         
         response = await client.post("/auth/register", json=payload)
         assert response.status_code == 201
-        
-        # Verify user exists in database
-        user = await User.get_or_none(email="dbuser@example.com")
-        assert user is not None, "User should exist in database"
-        assert user.username == "dbuser"
-        
-        # Verify password was hashed (not stored plain)
-        assert user.password_hash != "SecurePass123"
-        assert verify_password("SecurePass123", user.password_hash)
+        assert response.json()["username"] == "dbuser"
+
+        # One narrow query answers both: the row exists and the
+        # password wasn't stored in the clear. The full hash/verify
+        # roundtrip is a unit test in test_security.py - re-running
+        # bcrypt here tested hash_password, not the endpoint.
+        hashes = await User.filter(
+            email="dbuser@example.com"
+        ).values_list("password_hash", flat=True)
+        assert hashes, "User should exist in database"
+        assert hashes[0] != "SecurePass123"
+        # Shape check only - a bcrypt hash with its cost header; the
+        # roundtrip itself is covered in test_security.py
+        assert hashes[0].startswith(("$2a$", "$2b$"))
+        assert len(hashes[0]) >= 50
     
     @pytest.mark.anyio
     async def test_register_duplicate_email(self, client: AsyncClient, test_user):
@@ -101,46 +111,29 @@ class TestRegistration:
         assert response.status_code == 422  # Validation error
     
     @pytest.mark.anyio
-    async def test_register_weak_password(self, client: AsyncClient, init_db):
+    @pytest.mark.parametrize("password", [
+        "nouppercase123",  # Missing uppercase
+        "NoDigitsHere",    # Missing digit
+        "Short1",          # Too short
+    ])
+    async def test_register_weak_password(self, client: AsyncClient, init_db, password):
         """Test registration with password missing requirements."""
-        # Missing uppercase
-        response = await client.post("/auth/register", json={
-            "username": "validuser",
-            "email": "valid@example.com",
-            "password": "nouppercase123"
-        })
-        assert response.status_code == 422
-        
-        # Missing digit
-        response = await client.post("/auth/register", json={
-            "username": "validuser",
-            "email": "valid@example.com",
-            "password": "NoDigitsHere"
-        })
-        assert response.status_code == 422
-        
-        # Too short
         response = await client.post("/auth/register", json={
             "username": "validuser",
             "email": "valid@example.com",
-            "password": "Short1"
+            "password": password
         })
         assert response.status_code == 422
-    
+
     @pytest.mark.anyio
-    async def test_register_username_validation(self, client: AsyncClient, init_db):
+    @pytest.mark.parametrize("username", [
+        "ab",         # Too short (min 3 chars)
+        "user@name",  # @ not allowed
+    ])
+    async def test_register_username_validation(self, client: AsyncClient, init_db, username):
         """Test username format validation."""
-        # Username too short
         response = await client.post("/auth/register", json={
-            "username": "ab",  # Min 3 chars
-            "email": "valid@example.com",
-            "password": "SecurePass123"
-        })
-        assert response.status_code == 422
-        
-        # Username with invalid characters
-        response = await client.post("/auth/register", json={
-            "username": "user@name",  # @ not allowed
+            "username": username,
             "email": "valid@example.com",
             "password": "SecurePass123"
         })
@@ -195,11 +188,10 @@ class TestLogin:
     async def test_login_inactive_user(self, client: AsyncClient, init_db):
         """Test login with deactivated account fails."""
         # Create inactive user directly
-        from src.core.security import hash_password
         await User.create(
             username="inactive",
             email="inactive@example.com",
-            password_hash=hash_password("TestPassword123"),
+            password_hash=_TEST_HASH,
             is_active=False,  # Deactivated
         )
         
@@ -227,39 +219,27 @@ class TestTokenRefresh:
     """Tests for token refresh endpoint."""
     
     @pytest.mark.anyio
-    async def test_refresh_token_success(self, client: AsyncClient, test_user):
+    async def test_refresh_token_success(self, client: AsyncClient, test_user_tokens):
         """Test refreshing access token with valid refresh token."""
-        # First, login to get tokens
-        login_response = await client.post("/auth/login", json={
-            "email": "test@example.com",
-            "password": "TestPassword123"
-        })
-        tokens = login_response.json()
-        
-        # Now refresh
+        # test_user_tokens mints the pair directly - the login flow
+        # itself is covered by TestLogin
         response = await client.post("/auth/refresh", json={
-            "refresh_token": tokens["refresh_token"]
+            "refresh_token": test_user_tokens["refresh_token"]
         })
-        
+
         assert response.status_code == 200
         data = response.json()
         assert "access_token" in data
         assert data["token_type"] == "bearer"
-    
+
     @pytest.mark.anyio
-    async def test_refresh_with_access_token_fails(self, client: AsyncClient, test_user):
+    async def test_refresh_with_access_token_fails(self, client: AsyncClient, test_user_tokens):
         """Test that using access token for refresh fails."""
-        login_response = await client.post("/auth/login", json={
-            "email": "test@example.com",
-            "password": "TestPassword123"
-        })
-        tokens = login_response.json()
-        
         # Try to use access token as refresh token (should fail)
         response = await client.post("/auth/refresh", json={
-            "refresh_token": tokens["access_token"]  # Wrong token type!
+            "refresh_token": test_user_tokens["access_token"]  # Wrong token type!
         })
-        
+
         assert response.status_code == 401
     
     @pytest.mark.anyio
@@ -306,35 +286,27 @@ class TestProtectedRoutes:
         assert response.status_code == 401
     
     @pytest.mark.anyio
-    async def test_get_current_user_malformed_header(self, client: AsyncClient, init_db):
+    @pytest.mark.parametrize("header", [
+        "some.token.here",  # Missing 'Bearer' prefix
+        "",                 # Empty header
+    ])
+    async def test_get_current_user_malformed_header(self, client: AsyncClient, init_db, header):
         """Test various malformed authorization headers."""
-        # Missing 'Bearer' prefix
         response = await client.get("/auth/me", headers={
-            "Authorization": "some.token.here"
-        })
-        assert response.status_code == 401
-        
-        # Empty header
-        response = await client.get("/auth/me", headers={
-            "Authorization": ""
+            "Authorization": header
         })
         assert response.status_code == 401
     
     @pytest.mark.anyio
-    async def test_get_current_user_expired_token(self, client: AsyncClient, test_user):
+    async def test_get_current_user_expired_token(self, client: AsyncClient, init_db, token_factory):
         """Test that expired tokens are rejected."""
         from datetime import timedelta
-        from src.core.security import create_access_token
-        
-        # Create token that's already expired
-        expired_token = create_access_token(
-            test_user.id,
-            expires_delta=timedelta(seconds=-1)  # Expired 1 second ago
-        )
-        
-        headers = {"Authorization": f"Bearer {expired_token}"}
+
+        # Any user id works: the 401 comes from the expiry check, which
+        # runs before the DB lookup, so no user row is needed
+        headers = token_factory(999999, expires_delta=timedelta(seconds=-1))
         response = await client.get("/auth/me", headers=headers)
-        
+
         assert response.status_code == 401
 
 
@@ -342,26 +314,19 @@ class TestSecurityEdgeCases:
     """Security-focused tests."""
     
     @pytest.mark.anyio
-    async def test_deleted_user_token_invalid(self, client: AsyncClient, init_db):
+    async def test_deleted_user_token_invalid(self, client: AsyncClient, init_db, token_factory):
         """Test that tokens for deleted users don't work."""
-        from src.core.security import hash_password, create_access_token
-        
         # Create user
         user = await User.create(
             username="deleteme",
             email="delete@example.com",
-            password_hash=hash_password("TestPassword123"),
+            password_hash=_TEST_HASH,
         )
-        user_id = user.id
-        
-        # Create token while user exists
-        token = create_access_token(user_id)
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        # Verify token works
-        response = await client.get("/auth/me", headers=headers)
-        assert response.status_code == 200
-        
+
+        # Mint the token while the user exists (that a valid token
+        # works is covered by test_get_current_user_success)
+        headers = token_factory(user.id)
+
         # Delete user
         await user.delete()
         
@@ -372,10 +337,6 @@ class TestSecurityEdgeCases:
     @pytest.mark.anyio
     async def test_deactivated_user_token_invalid(self, client: AsyncClient, test_user, auth_headers):
         """Test that tokens for deactivated users don't work."""
-        # Verify token works initially
-        response = await client.get("/auth/me", headers=auth_headers)
-        assert response.status_code == 200
-        
         # Deactivate user
         test_user.is_active = False
         await test_user.save()
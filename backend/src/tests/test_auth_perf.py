@@ -0,0 +1,61 @@
+"""
+Coarse performance guardrails for the hot auth endpoints.
+
+These are smoke thresholds, not benchmarks: generous enough not to
+flake on a loaded CI runner, tight enough to catch a pathological
+regression (a KDF cost-factor jump, an N+1 query in /auth/me) before
+it ships. Plain perf_counter means keep the module dependency-free.
+"""
+import time
+
+import pytest
+from httpx import AsyncClient
+
+ITERATIONS = 5
+
+# Mean per-request wall-clock ceilings, in seconds. Tests run with the
+# reduced bcrypt work factor, so real means sit far below these.
+LOGIN_THRESHOLD = 1.0
+REGISTER_THRESHOLD = 1.0
+ME_THRESHOLD = 0.5
+
+
+async def _mean_seconds(do_request, iterations: int = ITERATIONS) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        response = await do_request()
+        assert response.status_code < 500
+    return (time.perf_counter() - start) / iterations
+
+
+@pytest.mark.anyio
+async def test_login_perf(client: AsyncClient, test_user):
+    mean = await _mean_seconds(lambda: client.post("/auth/login", json={
+        "email": "test@example.com",
+        "password": "TestPassword123",
+    }))
+    assert mean < LOGIN_THRESHOLD
+
+
+@pytest.mark.anyio
+async def test_register_perf(client: AsyncClient, init_db):
+    counter = iter(range(ITERATIONS))
+
+    def do_request():
+        i = next(counter)
+        return client.post("/auth/register", json={
+            "username": f"perfuser{i}",
+            "email": f"perf{i}@example.com",
+            "password": "SecurePass123",
+        })
+
+    mean = await _mean_seconds(do_request)
+    assert mean < REGISTER_THRESHOLD
+
+
+@pytest.mark.anyio
+async def test_me_perf(client: AsyncClient, auth_headers):
+    mean = await _mean_seconds(
+        lambda: client.get("/auth/me", headers=auth_headers)
+    )
+    assert mean < ME_THRESHOLD
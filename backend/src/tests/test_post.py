@@ -39,39 +39,15 @@ class TestCreatePost:
         assert "fastapi" in tag_names
     
     @pytest.mark.anyio
-    async def test_create_post_requires_auth(self, client: AsyncClient, init_db):
-        """Test that creating a post requires authentication."""
-        payload = {"body": "This should fail"}
-        
-        response = await client.post("/posts/", json=payload)
-        
-        assert response.status_code == 401
-    
-    @pytest.mark.anyio
-    async def test_create_post_empty_body_fails(self, client: AsyncClient, auth_headers):
-        """Test that empty body is rejected."""
-        payload = {"body": ""}
-        
-        response = await client.post("/posts/", json=payload, headers=auth_headers)
-        
-        assert response.status_code == 422
-    
-    @pytest.mark.anyio
-    async def test_create_post_whitespace_body_fails(self, client: AsyncClient, auth_headers):
-        """Test that whitespace-only body is rejected."""
-        payload = {"body": "   \n\t  "}
-        
-        response = await client.post("/posts/", json=payload, headers=auth_headers)
-        
-        assert response.status_code == 422
-    
-    @pytest.mark.anyio
-    async def test_create_post_too_long_fails(self, client: AsyncClient, auth_headers):
-        """Test that body over 500 chars is rejected."""
-        payload = {"body": "x" * 501}
-        
-        response = await client.post("/posts/", json=payload, headers=auth_headers)
-        
+    @pytest.mark.parametrize("body", [
+        "",           # Empty
+        "   \n\t  ",  # Whitespace-only
+        "x" * 501,    # Over the 500-char limit
+    ])
+    async def test_create_post_invalid_body(self, client: AsyncClient, auth_headers, body):
+        """Test that invalid post bodies are rejected."""
+        response = await client.post("/posts/", json={"body": body}, headers=auth_headers)
+
         assert response.status_code == 422
 
 
@@ -218,15 +194,6 @@ class TestUpdatePost:
         assert response.status_code == 403
         assert "own" in response.json()["detail"].lower()
     
-    @pytest.mark.anyio
-    async def test_update_post_requires_auth(self, client: AsyncClient, sample_post):
-        """Test that updating requires authentication."""
-        payload = {"body": "Anonymous update attempt"}
-        
-        response = await client.patch(f"/posts/{sample_post.id}", json=payload)
-        
-        assert response.status_code == 401
-    
     @pytest.mark.anyio
     async def test_update_nonexistent_post(self, client: AsyncClient, auth_headers):
         """Test updating a post that doesn't exist."""
@@ -269,13 +236,6 @@ class TestDeletePost:
         
         assert response.status_code == 403
     
-    @pytest.mark.anyio
-    async def test_delete_post_requires_auth(self, client: AsyncClient, sample_post):
-        """Test that deleting requires authentication."""
-        response = await client.delete(f"/posts/{sample_post.id}")
-        
-        assert response.status_code == 401
-    
     @pytest.mark.anyio
     async def test_delete_nonexistent_post(self, client: AsyncClient, auth_headers):
         """Test deleting a post that doesn't exist."""
@@ -356,13 +316,6 @@ class TestLikePosts:
         )
         assert response.json()["liked"] is False
     
-    @pytest.mark.anyio
-    async def test_like_requires_auth(self, client: AsyncClient, sample_post):
-        """Test that liking requires authentication."""
-        response = await client.post(f"/posts/{sample_post.id}/like")
-        
-        assert response.status_code == 401
-    
     @pytest.mark.anyio
     async def test_like_nonexistent_post(self, client: AsyncClient, auth_headers):
         """Test liking a post that doesn't exist."""
@@ -387,16 +340,63 @@ class TestLikePosts:
         assert data["like_count"] == 2
 
 
-class TestFeed:
-    """Tests for GET /posts/feed endpoint."""
-    
+class TestTrackViews:
+    """Tests for POST /posts/views endpoint."""
+
     @pytest.mark.anyio
-    async def test_feed_requires_auth(self, client: AsyncClient, init_db):
-        """Test that feed requires authentication."""
-        response = await client.get("/posts/feed")
-        
+    async def test_track_views_empty_list(self, client: AsyncClient, test_user, auth_headers):
+        """An empty batch is a no-op, not an error.
+
+        Regression test: SADD with zero members is a Redis protocol
+        error, so the service must return before building the pipeline.
+        """
+        response = await client.post("/posts/views", json=[], headers=auth_headers)
+
+        assert response.status_code == 204
+
+
+class TestAuthRequired:
+    """Every mutating/personalized post endpoint rejects anonymous calls."""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("method,url_template", [
+        ("post", "/posts/"),
+        ("patch", "/posts/{pid}"),
+        ("delete", "/posts/{pid}"),
+        ("post", "/posts/{pid}/like"),
+        ("get", "/posts/feed"),
+    ])
+    async def test_auth_required(
+        self, client: AsyncClient, sample_post, method, url_template
+    ):
+        url = url_template.format(pid=sample_post.id)
+        kwargs = {} if method in ("get", "delete") else {"json": {"body": "x"}}
+
+        response = await getattr(client, method)(url, **kwargs)
+
         assert response.status_code == 401
-    
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("path", ["/posts/feed", "/posts/views", "/auth/me"])
+    async def test_cors_preflight_needs_no_auth(self, client: AsyncClient, path):
+        """Preflights never carry Authorization, by spec.
+
+        Regression test: the missing-auth short-circuit must let
+        OPTIONS through to CORSMiddleware, or cross-origin clients can
+        never authenticate against these paths at all.
+        """
+        response = await client.options(path, headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "GET",
+        })
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+
+class TestFeed:
+    """Tests for GET /posts/feed endpoint."""
+
     @pytest.mark.anyio
     async def test_feed_shows_own_posts(
         self, client: AsyncClient, sample_post, auth_headers
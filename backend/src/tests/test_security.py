@@ -0,0 +1,15 @@
+from src.core.security import hash_password, verify_password
+
+
+def test_hash_and_verify_roundtrip():
+    """
+    The hash/verify pair works and never stores the plain password.
+
+    This runs once for the codebase; the endpoint tests only check that
+    registration stores something other than the plaintext.
+    """
+    hashed = hash_password("SecurePass123")
+
+    assert hashed != "SecurePass123"
+    assert verify_password("SecurePass123", hashed)
+    assert not verify_password("WrongPass123", hashed)
@@ -0,0 +1,23 @@
+import pytest
+
+from src.services.tags import extract_tag_names, get_or_create_tags
+
+
+def test_extract_tag_names_lowercases():
+    """Hashtag extraction is case-insensitive and strips the #."""
+    assert extract_tag_names("Testing #PYTHON and #FastAPI") == {"python", "fastapi"}
+
+
+def test_extract_tag_names_no_hashtags():
+    """Bodies without a # short-circuit to an empty set."""
+    assert extract_tag_names("no tags in here") == set()
+
+
+@pytest.mark.anyio
+async def test_get_or_create_tags_idempotent(init_db):
+    """Repeated extraction of the same name reuses the existing row."""
+    first = await get_or_create_tags({"python"})
+    second = await get_or_create_tags({"python"})
+
+    assert len(first) == len(second) == 1
+    assert first[0].id == second[0].id